@@ -58,7 +58,7 @@ def create_app(manifest_path: str) -> FastAPI:
     @app.get("/skills")
     def list_skills():
         """List all available skills."""
-        return {"skills": service.list_skills()}
+        return {"skills": [dict(skill) for skill in service.list_skills()]}
 
     return app
 
@@ -1,6 +1,6 @@
 """Dependency resolver implementation using Kahn's topological sort algorithm."""
 from collections import deque
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Sequence, Set, Tuple
 from lib.skill_router.models import Skill
 from lib.skill_router.interfaces.dependency import IDependencyResolver, ITopologicalSorter
 from lib.skill_router.dependency_graph import DependencyResult, MissingDependencyWarning
@@ -191,11 +191,11 @@ class KahnsDependencyResolver(IDependencyResolver):
             warnings=warnings
         )
 
-    def resolve_multi(self, skill_names: List[str], skills: Dict[str, Skill]) -> DependencyResult:
+    def resolve_multi(self, skill_names: Sequence[str], skills: Dict[str, Skill]) -> DependencyResult:
         """Resolve dependencies for multiple skills.
 
         Args:
-            skill_names: List of skill names to resolve
+            skill_names: Skill names to resolve
             skills: Dictionary mapping skill names to Skill objects
 
         Returns:
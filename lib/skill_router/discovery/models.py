@@ -21,7 +21,7 @@ def __post_init_skill_match__(self):
         raise ValueError("confidence must be between 0.0 and 1.0")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillSummary:
     """Represents a skill summary for LLM prompting.
 
@@ -40,7 +40,7 @@ class SkillSummary:
     __post_init__ = __post_init_skill_summary__
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillMatch:
     """Represents a matched skill with confidence and reasoning.
 
@@ -59,7 +59,7 @@ class SkillMatch:
     __post_init__ = __post_init_skill_match__
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
     """Represents a raw response from an LLM API.
 
@@ -77,7 +77,7 @@ class LLMResponse:
     finish_reason: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscoveryResult:
     """Represents the result of LLM-based skill discovery.
 
@@ -10,6 +10,32 @@ from lib.skill_router.interfaces.discovery import IResponseParser
 from lib.skill_router.discovery.models import LLMResponse, SkillMatch, DiscoveryResult
 from lib.skill_router.exceptions import ParseError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(text: str) -> Any:
+    """Decode JSON text, using orjson when it is installed.
+
+    orjson decodes several times faster than the stdlib and raises
+    orjson.JSONDecodeError, a subclass of json.JSONDecodeError, so callers
+    handle both backends the same way.
+
+    Args:
+        text: JSON text to decode
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class JSONResponseParser(IResponseParser):
     """Parses JSON responses from LLM into structured DiscoveryResult.
@@ -88,7 +114,7 @@ class JSONResponseParser(IResponseParser):
             json_text = text.strip()
 
         try:
-            return json.loads(json_text)
+            return _json_loads(json_text)
         except json.JSONDecodeError as e:
             raise ParseError(f"Invalid JSON: {str(e)}")
 
@@ -1,7 +1,7 @@
 """Data models for hook integration components."""
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class SkillRole(Enum):
@@ -33,10 +33,11 @@ class SkillContext:
     Attributes:
         route_type: How the match was found (skill, task, discovery)
         matched: Name of matched entity
-        execution_order: Skills in dependency-resolved order
+        execution_order: Skills in dependency-resolved order, as a tuple
+            shared with the RouteResult it came from
         sections: List of skill content sections
     """
     route_type: str
     matched: str
-    execution_order: List[str]
+    execution_order: Tuple[str, ...]
     sections: List[SkillSection] = field(default_factory=list)
@@ -1,7 +1,7 @@
 """Interfaces for router orchestration components."""
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Sequence, Tuple
 from enum import Enum
 
 
@@ -13,27 +13,30 @@ class RouteType(Enum):
     ERROR = "error"           # No match found
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RouteResult:
     """Represents the result of routing a user query.
 
+    Instances are fully immutable: sequence fields are stored as tuples, so
+    results can be shared and cached safely.
+
     Attributes:
         route_type: How the match was found (skill, task, discovery, error)
         matched: Name of matched skill or task
-        skills: List of skill names to load
+        skills: Tuple of skill names to load
         execution_order: Dependency-resolved order for skill loading
         tier: Which tier produced the match (1, 2, or 3)
         confidence: Match confidence (1.0 for tier 1/2, LLM confidence for tier 3)
     """
     route_type: RouteType
     matched: str
-    skills: List[str] = field(default_factory=list)
-    execution_order: List[str] = field(default_factory=list)
+    skills: Tuple[str, ...] = ()
+    execution_order: Tuple[str, ...] = ()
     tier: int = 0
     confidence: float = 1.0
 
     @classmethod
-    def skill_match(cls, skill_name: str, execution_order: List[str]) -> "RouteResult":
+    def skill_match(cls, skill_name: str, execution_order: Sequence[str]) -> "RouteResult":
         """Factory for Tier 1 skill match.
 
         Args:
@@ -46,19 +49,19 @@ class RouteResult:
         return cls(
             route_type=RouteType.SKILL,
             matched=skill_name,
-            skills=[skill_name],
-            execution_order=execution_order,
+            skills=(skill_name,),
+            execution_order=tuple(execution_order),
             tier=1,
             confidence=1.0
         )
 
     @classmethod
-    def task_match(cls, task_name: str, skills: List[str], execution_order: List[str]) -> "RouteResult":
+    def task_match(cls, task_name: str, skills: Sequence[str], execution_order: Sequence[str]) -> "RouteResult":
         """Factory for Tier 2 task match.
 
         Args:
             task_name: Name of the matched task
-            skills: List of skill names required by the task
+            skills: Skill names required by the task
             execution_order: Dependency-resolved execution order
 
         Returns:
@@ -67,14 +70,14 @@ class RouteResult:
         return cls(
             route_type=RouteType.TASK,
             matched=task_name,
-            skills=skills,
-            execution_order=execution_order,
+            skills=tuple(skills),
+            execution_order=tuple(execution_order),
             tier=2,
             confidence=1.0
         )
 
     @classmethod
-    def discovery_match(cls, skill_name: str, execution_order: List[str], confidence: float) -> "RouteResult":
+    def discovery_match(cls, skill_name: str, execution_order: Sequence[str], confidence: float) -> "RouteResult":
         """Factory for Tier 3 LLM discovery match.
 
         Args:
@@ -88,8 +91,8 @@ class RouteResult:
         return cls(
             route_type=RouteType.DISCOVERY,
             matched=skill_name,
-            skills=[skill_name],
-            execution_order=execution_order,
+            skills=(skill_name,),
+            execution_order=tuple(execution_order),
             tier=3,
             confidence=confidence
         )
@@ -99,16 +102,9 @@ class RouteResult:
         """Factory for no match (error) result.
 
         Returns:
-            RouteResult with error type and empty data
+            RouteResult with error type and empty data (a shared instance)
         """
-        return cls(
-            route_type=RouteType.ERROR,
-            matched="",
-            skills=[],
-            execution_order=[],
-            tier=0,
-            confidence=0.0
-        )
+        return _NO_MATCH_RESULT
 
     def is_match(self) -> bool:
         """Check if this result represents a valid match.
@@ -119,6 +115,16 @@ class RouteResult:
         return self.route_type != RouteType.ERROR
 
 
+_NO_MATCH_RESULT = RouteResult(
+    route_type=RouteType.ERROR,
+    matched="",
+    skills=(),
+    execution_order=(),
+    tier=0,
+    confidence=0.0
+)
+
+
 class IRouter(ABC):
     """Interface for the top-level skill routing orchestrator.
 
@@ -1,8 +1,15 @@
 """Manifest loader implementation for parsing YAML manifests."""
+import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 import yaml
 
+try:
+    # LibYAML C bindings parse several times faster when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from lib.skill_router.interfaces.manifest import IManifestLoader
 from lib.skill_router.models import Manifest, Skill, Task, Category
 from lib.skill_router.exceptions import (
@@ -14,8 +21,42 @@ from lib.skill_router.exceptions import (
 from lib.skill_router.manifest_validator import ManifestValidator
 
 
+def _intern(value: Any) -> Any:
+    """Intern a name or trigger phrase read from the manifest.
+
+    YAML turns keys such as ``404:`` or ``yes:`` into ints and bools, which
+    cannot be interned, so anything other than a string is returned as is.
+
+    Args:
+        value: Value read from the manifest
+
+    Returns:
+        The interned string, or the value unchanged if it is not a string
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_names(names: List[Any]) -> List[Any]:
+    """Intern a list of names or trigger phrases.
+
+    Args:
+        names: Values read from the manifest
+
+    Returns:
+        List with every string interned
+    """
+    return [_intern(name) for name in names]
+
+
 class ManifestLoader(IManifestLoader):
-    """Loads and parses YAML manifests into Manifest objects."""
+    """Loads and parses YAML manifests into Manifest objects.
+
+    Skill, task and category names are interned as they are parsed, so the
+    same name used as a dict key, a dependency and a task reference is a
+    single string object and lookups compare by identity first. Trigger
+    phrases are interned too, so a matched trigger compares against the
+    same phrase from elsewhere by identity.
+    """
 
     def __init__(self):
         """Initialize the manifest loader with a validator."""
@@ -65,37 +106,54 @@ class ManifestLoader(IManifestLoader):
             ManifestParseError: If the YAML is invalid
         """
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=SafeLoader)
 
             if data is None:
                 raise ManifestParseError("Empty manifest")
 
-            # Parse skills section
-            skills = self._parse_skills(data.get('skills', {}))
+            return self.load_from_dict(data)
+        except yaml.YAMLError as e:
+            line = getattr(e, 'problem_mark', None)
+            line_num = line.line + 1 if line else None
+            raise ManifestParseError(f"Invalid YAML syntax: {e!s}", line=line_num) from e
+
+    def load_from_dict(self, data: Dict[str, Any]) -> Manifest:
+        """Load a manifest from already parsed data.
 
-            # Parse tasks section
-            tasks = self._parse_tasks(data.get('tasks', {}))
+        Accepts the same structure as the YAML document, which lets callers
+        that build manifests in code skip YAML parsing.
 
-            # Parse categories section
-            categories = self._parse_categories(data.get('categories', {}))
+        Args:
+            data: Mapping with optional 'skills', 'tasks' and 'categories' sections
 
-            # Create manifest
-            manifest = Manifest(
-                skills=skills,
-                tasks=tasks,
-                categories=categories
-            )
+        Returns:
+            Parsed Manifest object
 
-            # Validate manifest
-            validation_errors = self.validator.validate(manifest)
-            if validation_errors:
-                raise ManifestValidationError(validation_errors)
+        Raises:
+            ManifestValidationError: If validation fails
+        """
+        # Parse skills section
+        skills = self._parse_skills(data.get('skills', {}))
 
-            return manifest
-        except yaml.YAMLError as e:
-            line = getattr(e, 'problem_mark', None)
-            line_num = line.line + 1 if line else None
-            raise ManifestParseError(f"Invalid YAML syntax: {e!s}", line=line_num) from e
+        # Parse tasks section
+        tasks = self._parse_tasks(data.get('tasks', {}))
+
+        # Parse categories section
+        categories = self._parse_categories(data.get('categories', {}))
+
+        # Create manifest
+        manifest = Manifest(
+            skills=skills,
+            tasks=tasks,
+            categories=categories
+        )
+
+        # Validate manifest
+        validation_errors = self.validator.validate(manifest)
+        if validation_errors:
+            raise ManifestValidationError(validation_errors)
+
+        return manifest
 
     def _parse_skills(self, skills_data: Dict[str, Any]) -> Dict[str, Skill]:
         """Parse skills section into Skill objects.
@@ -108,11 +166,12 @@ class ManifestLoader(IManifestLoader):
         """
         skills = {}
         for name, data in skills_data.items():
+            name = _intern(name)
             skill = Skill(
                 name=name,
                 description=data.get('description', ''),
                 path=data.get('path', ''),
-                depends_on=data.get('depends_on', [])
+                depends_on=_intern_names(data.get('depends_on', []))
             )
             skills[name] = skill
         return skills
@@ -128,11 +187,12 @@ class ManifestLoader(IManifestLoader):
         """
         tasks = {}
         for name, data in tasks_data.items():
+            name = _intern(name)
             task = Task(
                 name=name,
                 description=data.get('description', ''),
-                triggers=data.get('triggers', []),
-                skills=data.get('skills', [])
+                triggers=_intern_names(data.get('triggers', [])),
+                skills=_intern_names(data.get('skills', []))
             )
             tasks[name] = task
         return tasks
@@ -148,11 +208,12 @@ class ManifestLoader(IManifestLoader):
         """
         categories = {}
         for name, data in categories_data.items():
+            name = _intern(name)
             category = Category(
                 name=name,
                 description=data.get('description', ''),
-                tasks=data.get('tasks', []),
-                skills=data.get('skills', [])
+                tasks=_intern_names(data.get('tasks', [])),
+                skills=_intern_names(data.get('skills', []))
             )
             categories[name] = category
         return categories
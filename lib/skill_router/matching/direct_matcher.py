@@ -1,9 +1,12 @@
 """Direct skill matcher implementation."""
-from typing import Dict, Optional
-from lib.skill_router.models import Skill
+import sys
+from typing import Dict, Mapping, Optional, Tuple
+from lib.skill_router.models import FrozenDict, Skill
 from lib.skill_router.interfaces.matching import ISkillMatcher, IQueryNormalizer, IPatternRegistry
 from lib.skill_router.matching.result import MatchResult
 
+_SkillIndex = Tuple[Optional[Mapping[str, Skill]], Tuple[str, ...], Dict[str, str], Tuple[str, ...]]
+
 
 class DirectSkillMatcher(ISkillMatcher):
     """Matches user queries containing skill names directly.
@@ -14,6 +17,17 @@ class DirectSkillMatcher(ISkillMatcher):
 
     Longer skill names are prioritized over shorter ones to handle
     substring matches correctly (e.g., "terraform-base" vs "terraform").
+
+    Exact matching is split into a static part and a scan. A map of
+    lowercased skill names answers queries that are, or contain as a token,
+    a skill name with a hash lookup; only when that misses are skill names
+    scanned as substrings. The map and the longest-first name order are
+    rebuilt only when the set of skill names changes. Manifest.skills is a
+    FrozenDict and cannot change, so passing the same one again reuses
+    them without looking at the names; any other mapping, including a
+    MappingProxyType over a dict that may still change, has its names
+    compared on every call. They are published together as one
+    tuple, so concurrent matches never see a half-built index.
     """
 
     def __init__(self, normalizer: IQueryNormalizer, pattern_registry: Optional[IPatternRegistry] = None):
@@ -25,6 +39,8 @@ class DirectSkillMatcher(ISkillMatcher):
         """
         self.normalizer = normalizer
         self.pattern_registry = pattern_registry
+        # (FrozenDict or None, names, exact-match map, longest-first names)
+        self._index: _SkillIndex = (None, (), {}, ())
 
     def match(self, query: str, skills: Dict[str, Skill]) -> MatchResult:
         """Match a query against available skills using exact and pattern matching.
@@ -39,9 +55,19 @@ class DirectSkillMatcher(ISkillMatcher):
         # Normalize the query
         normalized_query = self.normalizer.normalize(query)
 
-        # Sort skill names by length descending (longer names first)
+        # Skill names sorted by length descending (longer names first)
         # This ensures "terraform-base" matches before "terraform"
-        skill_names = sorted(skills.keys(), key=len, reverse=True)
+        exact_names, skill_names = self._index_skills(skills)
+
+        # Static map: the whole query is a skill name
+        skill_name = exact_names.get(normalized_query)
+        if skill_name is not None:
+            return MatchResult.exact_match(skill_name)
+
+        # Static map: a query token is a skill name
+        token_match = self._match_skill_token(normalized_query, exact_names, skill_names)
+        if token_match is not None:
+            return MatchResult.exact_match(token_match)
 
         # Try exact match first (confidence 1.0)
         for skill_name in skill_names:
@@ -60,3 +86,63 @@ class DirectSkillMatcher(ISkillMatcher):
 
         # No match found
         return MatchResult.no_match()
+
+    def _index_skills(self, skills: Mapping[str, Skill]) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+        """Return the exact-match map and name order, rebuilding them if needed.
+
+        Args:
+            skills: Dictionary mapping skill names to Skill objects
+
+        Returns:
+            Tuple of (lowercased name to skill name map, names longest first)
+        """
+        indexed_mapping, indexed_names, exact_names, sorted_names = self._index
+        if skills is indexed_mapping:
+            return exact_names, sorted_names
+
+        mapping = skills if type(skills) is FrozenDict else None
+        names = tuple(skills)
+        if names != indexed_names:
+            exact_names = {}
+            for name in names:
+                exact_names.setdefault(sys.intern(name.lower()), name)
+            sorted_names = tuple(sorted(names, key=len, reverse=True))
+        elif mapping is None:
+            return exact_names, sorted_names
+
+        self._index = (mapping, names, exact_names, sorted_names)
+        return exact_names, sorted_names
+
+    @staticmethod
+    def _match_skill_token(
+        normalized_query: str, exact_names: Dict[str, str], sorted_names: Tuple[str, ...]
+    ) -> Optional[str]:
+        """Find a skill name appearing as a whole token in the query.
+
+        The token only wins if no other skill name of equal or greater length
+        also appears in the query, which keeps the result identical to the
+        longest-first substring scan.
+
+        Args:
+            normalized_query: Normalized user query
+            exact_names: Map of lowercased skill names to skill names
+            sorted_names: Skill names, longest first
+
+        Returns:
+            Matched skill name, or None if the full scan is required
+        """
+        candidate = max(
+            (exact_names[token] for token in normalized_query.split() if token in exact_names),
+            key=len,
+            default=None
+        )
+        if candidate is None:
+            return None
+
+        for skill_name in sorted_names:
+            if len(skill_name) < len(candidate):
+                break
+            if skill_name != candidate and skill_name.lower() in normalized_query:
+                return None
+
+        return candidate
@@ -1,9 +1,9 @@
 """Match result data structures."""
-from dataclasses import dataclass, field
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     """Represents the result of a skill matching operation.
 
@@ -22,8 +22,9 @@ class MatchResult:
 
         Returns:
             MatchResult with no skill name, no type, and 0.0 confidence
+            (a shared instance)
         """
-        return cls(skill_name=None, match_type=None, confidence=0.0)
+        return _NO_SKILL_MATCH
 
     @classmethod
     def exact_match(cls, skill_name: str) -> "MatchResult":
@@ -50,7 +51,10 @@ class MatchResult:
         return cls(skill_name=skill_name, match_type="pattern", confidence=0.9)
 
 
-@dataclass
+_NO_SKILL_MATCH = MatchResult(skill_name=None, match_type=None, confidence=0.0)
+
+
+@dataclass(frozen=True, slots=True)
 class TaskMatchResult:
     """Represents the result of a task matching operation.
 
@@ -58,12 +62,12 @@ class TaskMatchResult:
         task_name: Name of matched task, or None if no match
         score: Match score (0.0-1.0)
         matched_trigger: The trigger phrase that matched, or None
-        skills: List of skill names required by the matched task
+        skills: Tuple of skill names required by the matched task
     """
     task_name: Optional[str]
     score: float
     matched_trigger: Optional[str]
-    skills: List[str] = field(default_factory=list)
+    skills: Tuple[str, ...] = ()
 
     @classmethod
     def no_match(cls) -> "TaskMatchResult":
@@ -71,18 +75,20 @@ class TaskMatchResult:
 
         Returns:
             TaskMatchResult with no task name, 0.0 score, and empty skills
+            (a shared instance)
         """
-        return cls(task_name=None, score=0.0, matched_trigger=None, skills=[])
+        return _NO_TASK_MATCH
 
     @classmethod
-    def from_task(cls, task_name: str, score: float, matched_trigger: str, skills: List[str]) -> "TaskMatchResult":
+    def from_task(cls, task_name: str, score: float, matched_trigger: str, skills: Sequence[str]) -> "TaskMatchResult":
         """Factory method for creating result from a matched task.
 
         Args:
             task_name: Name of the matched task
             score: Match score (0.0-1.0)
             matched_trigger: The trigger phrase that matched
-            skills: List of skill names required by the task
+            skills: Skill names required by the task. Lists are copied into a
+                tuple; a tuple (as stored on Task) is shared as-is.
 
         Returns:
             TaskMatchResult populated with task data
@@ -91,7 +97,7 @@ class TaskMatchResult:
             task_name=task_name,
             score=score,
             matched_trigger=matched_trigger,
-            skills=skills.copy()  # Copy to avoid reference issues
+            skills=tuple(skills)  # Immutable copy; no-op for tuples
         )
 
     def is_match(self) -> bool:
@@ -101,3 +107,6 @@ class TaskMatchResult:
             True if a task was matched (task_name is not None), False otherwise
         """
         return self.task_name is not None
+
+
+_NO_TASK_MATCH = TaskMatchResult(task_name=None, score=0.0, matched_trigger=None, skills=())
@@ -37,12 +37,17 @@ class WordOverlapScorer(IWordOverlapScorer):
         if not query_words:
             return 0.0
 
-        # Calculate overlap: intersection size / trigger size
-        overlap = query_words.intersection(trigger_words)
-        coverage = len(overlap) / len(trigger_words)
+        threshold = self.threshold
+        trigger_size = len(trigger_words)
 
-        # Return 0.0 if below threshold
-        if coverage < self.threshold:
+        # The overlap cannot exceed the query size, so a query too short to
+        # reach the threshold is rejected without intersecting
+        if len(query_words) / trigger_size < threshold:
             return 0.0
 
-        return coverage
+        # Calculate overlap: intersection size / trigger size. Set
+        # intersection runs in C and iterates the smaller operand.
+        coverage = len(trigger_words.intersection(query_words)) / trigger_size
+
+        # Return 0.0 if below threshold
+        return coverage if coverage >= threshold else 0.0
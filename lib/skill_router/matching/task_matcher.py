@@ -1,15 +1,83 @@
 """Task trigger matching implementation."""
-from typing import Dict
+from dataclasses import dataclass, replace
+from itertools import compress
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from lib.skill_router.interfaces.matching import ITaskMatcher, IWordTokenizer, IWordOverlapScorer
-from lib.skill_router.models import Task
+from lib.skill_router.models import FrozenDict, Task
 from lib.skill_router.matching.result import TaskMatchResult
 
 
+@dataclass(frozen=True, slots=True)
+class _TriggerIndex:
+    """Flattened trigger index for one tasks mapping.
+
+    Built completely before it is published, then replaced as a whole, so
+    a concurrent match sees either the old index or the new one.
+    """
+    # Set only for FrozenDicts, whose identity implies their contents
+    mapping: Optional[Mapping[str, Task]]
+    items: Tuple[Tuple[str, Task], ...]
+    word_bits: Dict[str, int]
+    # Per task, by manifest position
+    task_names: Tuple[str, ...]
+    task_skills: Tuple[Tuple[str, ...], ...]
+    task_masks: Tuple[int, ...]
+    task_bounds: Tuple[Tuple[int, int], ...]
+    # Per trigger, flattened in manifest order
+    trigger_texts: Tuple[str, ...]
+    trigger_word_sets: Tuple[FrozenSet[str], ...]
+    trigger_masks: Tuple[int, ...]
+    trigger_owners: Tuple[int, ...]
+    # First trigger with each distinct word set, recorded while indexing
+    first_triggers: Dict[FrozenSet[str], int]
+    # Earliest trigger contained in each word set, filled in on first use
+    exact_triggers: Dict[FrozenSet[str], int]
+
+
+_EMPTY_INDEX = _TriggerIndex(
+    mapping=None, items=(), word_bits={},
+    task_names=(), task_skills=(), task_masks=(), task_bounds=(),
+    trigger_texts=(), trigger_word_sets=(), trigger_masks=(), trigger_owners=(),
+    first_triggers={}, exact_triggers={}
+)
+
+
 class TaskTriggerMatcher(ITaskMatcher):
     """Matches user queries to tasks using word overlap scoring.
 
     Uses dependency injection for tokenizer and scorer to enable
     flexible matching strategies.
+
+    Trigger phrases come from the manifest and repeat on every query, so
+    each phrase is tokenized once and its word set reused; only the query
+    is tokenized per call.
+
+    For each tasks mapping the matcher keeps an index. Manifest.tasks is a
+    FrozenDict of frozen Tasks and cannot change, so passing the same one
+    again reuses the index without looking at the entries. Any other
+    mapping, including a MappingProxyType over a dict that may still
+    change, is compared by its entries on every call and re-indexed only
+    if they differ, so changes made in place are picked up. Every trigger word gets a bit, and triggers are stored
+    flattened into parallel tuples (text, word set, mask, owning task) in
+    manifest order. The index is an immutable object swapped in with one
+    assignment, and each match works from the one it read, so matching is
+    safe from concurrent threads.
+
+    A trigger sharing no word with the query cannot score above zero. Each
+    task also keeps the union of its trigger masks and a contiguous range
+    of trigger ids. A pass of map() and compress() over the task masks,
+    running in C, picks the tasks sharing a word with the query; only
+    their triggers are checked against the query mask, and only
+    overlapping triggers reach the scorer.
+
+    Queries that are exactly a trigger phrase are common. The index records
+    the first trigger for each distinct trigger word set. The first query
+    with that word set looks up the earliest trigger contained in it, which
+    is the trigger a full scan would settle on with a perfect score, and
+    remembers it. Only tasks sharing a word with the set are scanned. Later
+    queries with that word set score this one trigger first and return it
+    if the scorer confirms a perfect score. Doing this while indexing would
+    compare every trigger with every other.
     """
 
     def __init__(self, tokenizer: IWordTokenizer, scorer: IWordOverlapScorer):
@@ -21,6 +89,8 @@ class TaskTriggerMatcher(ITaskMatcher):
         """
         self.tokenizer = tokenizer
         self.scorer = scorer
+        self._trigger_words: Dict[str, FrozenSet[str]] = {}
+        self._index = _EMPTY_INDEX
 
     def match(self, query: str, tasks: Dict[str, Task]) -> TaskMatchResult:
         """Match a query against available tasks.
@@ -42,40 +112,197 @@ class TaskTriggerMatcher(ITaskMatcher):
         if not query_words:
             return TaskMatchResult.no_match()
 
-        best_score = 0.0
-        best_task_name = None
-        best_trigger = None
-        best_skills = []
+        # Work from one index snapshot even if another thread re-indexes
+        index = self._index_tasks(tasks)
 
-        # Check all tasks and their triggers
-        for task_name, task in tasks.items():
-            if not task.triggers:
-                continue
+        # Exact trigger word set: try the trigger a full scan would pick
+        query_key = frozenset(query_words)
+        exact_trigger = index.exact_triggers.get(query_key)
+        if exact_trigger is None and query_key in index.first_triggers:
+            exact_trigger = self._resolve_exact_trigger(index, query_key)
+        if exact_trigger is not None:
+            exact_score = self.scorer.score(query_words, index.trigger_word_sets[exact_trigger])
+            if exact_score >= 1.0:
+                return self._trigger_result(index, exact_trigger, exact_score)
 
-            # Check each trigger for this task
-            for trigger in task.triggers:
-                trigger_words = self.tokenizer.tokenize(trigger)
+        word_bits = index.word_bits
+        query_mask = sum(word_bits[word] for word in query_words if word in word_bits)
+        if not query_mask:
+            return TaskMatchResult.no_match()
 
-                if not trigger_words:
-                    continue
+        trigger_word_sets = index.trigger_word_sets
+        trigger_masks = index.trigger_masks
+        score = self.scorer.score
+
+        # Trigger ids sharing a word with the query, in manifest order so
+        # ties resolve exactly as a full scan would
+        task_bounds = index.task_bounds
+        task_masks = index.task_masks
+        overlapping = (
+            trigger
+            for position in compress(range(len(task_masks)), map(query_mask.__and__, task_masks))
+            for trigger in range(*task_bounds[position])
+            if trigger_masks[trigger] & query_mask
+        )
 
-                # Score this trigger
-                score = self.scorer.score(query_words, trigger_words)
+        best_score = 0.0
+        best_trigger = -1
 
-                # Update best if this is better
-                if score > best_score:
-                    best_score = score
-                    best_task_name = task_name
-                    best_trigger = trigger
-                    best_skills = task.skills
+        for trigger in overlapping:
+            # Score this trigger
+            trigger_score = score(query_words, trigger_word_sets[trigger])
 
-        # Return no match if nothing scored above threshold (scorer returns 0.0)
-        if best_score == 0.0 or best_task_name is None:
+            # Update best if this is better
+            if trigger_score > best_score:
+                best_score = trigger_score
+                best_trigger = trigger
+                # A perfect score cannot be beaten by a later trigger
+                if best_score >= 1.0:
+                    break
+
+        # Only a positive score records a trigger, and the scorer returns 0.0
+        # below its threshold, so no recorded trigger means no match
+        if best_trigger < 0:
             return TaskMatchResult.no_match()
 
+        return self._trigger_result(index, best_trigger, best_score)
+
+    @staticmethod
+    def _resolve_exact_trigger(index: _TriggerIndex, trigger_words: FrozenSet[str]) -> int:
+        """Find and remember the earliest trigger contained in a trigger word set.
+
+        Args:
+            index: Index the word set belongs to
+            trigger_words: Word set of at least one indexed trigger
+
+        Returns:
+            Index of the earliest trigger whose words all appear in the set
+        """
+        mask = index.trigger_masks[index.first_triggers[trigger_words]]
+        trigger_masks = index.trigger_masks
+        task_bounds = index.task_bounds
+        task_masks = index.task_masks
+        # The first trigger with this word set qualifies, so the scan ends by then
+        earliest = next(
+            trigger
+            for position in compress(range(len(task_masks)), map(mask.__and__, task_masks))
+            for trigger in range(*task_bounds[position])
+            if trigger_masks[trigger] & mask == trigger_masks[trigger]
+        )
+        # Concurrent resolutions store the same value
+        index.exact_triggers[trigger_words] = earliest
+        return earliest
+
+    @staticmethod
+    def _trigger_result(index: _TriggerIndex, trigger: int, score: float) -> TaskMatchResult:
+        """Build the match result for an indexed trigger.
+
+        Args:
+            index: Index the trigger belongs to
+            trigger: Index of the matched trigger
+            score: Score the trigger received
+
+        Returns:
+            TaskMatchResult for the task owning the trigger
+        """
+        owner = index.trigger_owners[trigger]
         return TaskMatchResult.from_task(
-            task_name=best_task_name,
-            score=best_score,
-            matched_trigger=best_trigger,
-            skills=best_skills
+            task_name=index.task_names[owner],
+            score=score,
+            matched_trigger=index.trigger_texts[trigger],
+            skills=index.task_skills[owner]
         )
+
+    def _index_tasks(self, tasks: Dict[str, Task]) -> _TriggerIndex:
+        """Return the trigger index for a tasks mapping, rebuilding it if needed.
+
+        The new index is published with a single assignment, so concurrent
+        callers never observe a partially built one.
+
+        Args:
+            tasks: Dictionary mapping task names to Task objects
+
+        Returns:
+            Trigger index for the given tasks
+        """
+        index = self._index
+        if tasks is index.mapping:
+            return index
+
+        mapping = tasks if type(tasks) is FrozenDict else None
+        items = tuple(tasks.items())
+        if items == index.items:
+            if mapping is not None:
+                index = replace(index, mapping=mapping)
+                self._index = index
+            return index
+
+        word_bits: Dict[str, int] = {}
+        task_names: List[str] = []
+        task_skills: List[Tuple[str, ...]] = []
+        task_masks: List[int] = []
+        task_bounds: List[Tuple[int, int]] = []
+        trigger_texts: List[str] = []
+        trigger_word_sets: List[FrozenSet[str]] = []
+        trigger_masks: List[int] = []
+        trigger_owners: List[int] = []
+
+        for position, (task_name, task) in enumerate(items):
+            start = len(trigger_texts)
+            task_mask = 0
+            for trigger in task.triggers:
+                trigger_words = self._tokenize_trigger(trigger)
+                if not trigger_words:
+                    continue
+                mask = 0
+                for word in trigger_words:
+                    bit = word_bits.get(word)
+                    if bit is None:
+                        bit = word_bits[word] = 1 << len(word_bits)
+                    mask |= bit
+                trigger_texts.append(trigger)
+                trigger_word_sets.append(trigger_words)
+                trigger_masks.append(mask)
+                trigger_owners.append(position)
+                task_mask |= mask
+            task_names.append(task_name)
+            task_skills.append(task.skills)
+            task_masks.append(task_mask)
+            task_bounds.append((start, len(trigger_texts)))
+
+        first_triggers: Dict[FrozenSet[str], int] = {}
+        for trigger, trigger_words in enumerate(trigger_word_sets):
+            first_triggers.setdefault(trigger_words, trigger)
+
+        index = _TriggerIndex(
+            mapping=mapping,
+            items=items,
+            word_bits=word_bits,
+            task_names=tuple(task_names),
+            task_skills=tuple(task_skills),
+            task_masks=tuple(task_masks),
+            task_bounds=tuple(task_bounds),
+            trigger_texts=tuple(trigger_texts),
+            trigger_word_sets=tuple(trigger_word_sets),
+            trigger_masks=tuple(trigger_masks),
+            trigger_owners=tuple(trigger_owners),
+            first_triggers=first_triggers,
+            exact_triggers={}
+        )
+        self._index = index
+        return index
+
+    def _tokenize_trigger(self, trigger: str) -> FrozenSet[str]:
+        """Tokenize a trigger phrase, reusing the word set on later calls.
+
+        Args:
+            trigger: Trigger phrase from a task
+
+        Returns:
+            Frozen set of normalized trigger words
+        """
+        words = self._trigger_words.get(trigger)
+        if words is None:
+            words = frozenset(self.tokenizer.tokenize(trigger))
+            self._trigger_words[trigger] = words
+        return words
@@ -1,8 +1,26 @@
 """Word tokenization for task trigger matching."""
-from typing import Set
+import functools
+from typing import FrozenSet
 from lib.skill_router.interfaces.matching import IWordTokenizer
 
 
+_NO_WORDS: FrozenSet[str] = frozenset()
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize_text(text: str) -> FrozenSet[str]:
+    """Lowercase and split text into a word set, memoized on the text.
+
+    Args:
+        text: Non-empty input text
+
+    Returns:
+        Frozen set of normalized word tokens
+    """
+    # split() without a separator also drops surrounding whitespace
+    return frozenset(text.lower().split())
+
+
 class WordTokenizer(IWordTokenizer):
     """Tokenizes text into normalized word sets.
 
@@ -10,27 +28,27 @@ class WordTokenizer(IWordTokenizer):
     - Converting to lowercase
     - Stripping leading/trailing whitespace
     - Splitting on whitespace (handles multiple spaces)
+
+    Word sets are returned as frozensets so they can be cached and shared.
+    The tokenizer has no configuration, so one process-wide LRU cache
+    serves every instance and repeated queries skip tokenization.
     """
 
-    def tokenize(self, text: str) -> Set[str]:
+    def tokenize(self, text: str) -> FrozenSet[str]:
         """Tokenize text into a set of normalized words.
 
         Args:
             text: Input text to tokenize
 
         Returns:
-            Set of normalized word tokens
+            Frozen set of normalized word tokens
         """
         if not text:
-            return set()
-
-        # Normalize: lowercase and strip
-        normalized = text.lower().strip()
-
-        if not normalized:
-            return set()
+            return _NO_WORDS
 
-        # Split on whitespace and filter empty strings
-        words = normalized.split()
+        return _tokenize_text(text)
 
-        return set(words)
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the shared tokenization cache."""
+        _tokenize_text.cache_clear()
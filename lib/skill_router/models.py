@@ -1,9 +1,32 @@
 """Data models for the Skill Router system."""
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Mapping, Tuple
 
 
-@dataclass
+class FrozenDict(dict):
+    """A dict snapshot whose contents cannot change after construction.
+
+    Manifest sections are stored as FrozenDicts. Because every mutating
+    method raises, a matcher that has indexed one may reuse the index
+    whenever it sees the same object again. This is not true of a
+    MappingProxyType, which is a live view of a dict that may still change.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        """Reject any attempt to modify the snapshot."""
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        """Pickle as a FrozenDict built from a plain copy of the contents."""
+        return (type(self), (dict(self),))
+
+
+@dataclass(frozen=True, slots=True)
 class Skill:
     """Represents a skill in the manifest.
 
@@ -11,55 +34,82 @@ class Skill:
         name: Unique identifier for the skill
         description: Human-readable description
         path: File system path to skill implementation
-        depends_on: List of skill names this skill depends on
+        depends_on: Skill names this skill depends on, frozen into a tuple
     """
     name: str
     description: str
     path: str
-    depends_on: List[str] = field(default_factory=list)
+    depends_on: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        """Freeze depends_on into a tuple."""
+        object.__setattr__(self, "depends_on", tuple(self.depends_on))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Task:
     """Represents a task in the manifest.
 
+    Tasks are frozen: matchers index them once and share them between
+    routes, so they must not change after construction.
+
     Attributes:
         name: Unique identifier for the task
         description: Human-readable description
-        triggers: List of phrases that trigger this task
-        skills: List of skill names required for this task
+        triggers: Phrases that trigger this task, frozen into a tuple
+        skills: Skill names required for this task, frozen into a tuple so
+            it can be shared by match and route results without copying
     """
     name: str
     description: str
-    triggers: List[str] = field(default_factory=list)
-    skills: List[str] = field(default_factory=list)
+    triggers: Tuple[str, ...] = ()
+    skills: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        """Freeze triggers and skills into tuples."""
+        object.__setattr__(self, "triggers", tuple(self.triggers))
+        object.__setattr__(self, "skills", tuple(self.skills))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Category:
     """Represents a category in the manifest.
 
     Attributes:
         name: Unique identifier for the category
         description: Human-readable description
-        tasks: List of task names in this category
-        skills: List of skill names in this category
+        tasks: Task names in this category, frozen into a tuple
+        skills: Skill names in this category, frozen into a tuple
     """
     name: str
     description: str
-    tasks: List[str] = field(default_factory=list)
-    skills: List[str] = field(default_factory=list)
+    tasks: Tuple[str, ...] = ()
+    skills: Tuple[str, ...] = ()
 
+    def __post_init__(self):
+        """Freeze tasks and skills into tuples."""
+        object.__setattr__(self, "tasks", tuple(self.tasks))
+        object.__setattr__(self, "skills", tuple(self.skills))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Manifest:
     """Represents the complete manifest structure.
 
+    Manifests are shared between services and routers, so they are frozen
+    and each section is copied into a FrozenDict at construction.
+
     Attributes:
-        skills: Dictionary mapping skill names to Skill objects
-        tasks: Dictionary mapping task names to Task objects
-        categories: Dictionary mapping category names to Category objects
+        skills: Read-only mapping of skill names to Skill objects
+        tasks: Read-only mapping of task names to Task objects
+        categories: Read-only mapping of category names to Category objects
     """
-    skills: Dict[str, Skill] = field(default_factory=dict)
-    tasks: Dict[str, Task] = field(default_factory=dict)
-    categories: Dict[str, Category] = field(default_factory=dict)
+    skills: Mapping[str, Skill] = field(default_factory=dict)
+    tasks: Mapping[str, Task] = field(default_factory=dict)
+    categories: Mapping[str, Category] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Snapshot each section into a FrozenDict."""
+        object.__setattr__(self, "skills", FrozenDict(self.skills))
+        object.__setattr__(self, "tasks", FrozenDict(self.tasks))
+        object.__setattr__(self, "categories", FrozenDict(self.categories))
@@ -3,6 +3,9 @@ import re
 from lib.skill_router.interfaces.matching import IQueryNormalizer
 
 
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+
 class QueryNormalizer(IQueryNormalizer):
     """Normalizes query strings for consistent matching.
 
@@ -10,6 +13,9 @@ class QueryNormalizer(IQueryNormalizer):
     1. Lowercase conversion
     2. Trim leading/trailing whitespace
     3. Collapse multiple spaces to single space
+
+    The normalizer holds no state, so a single shared instance
+    (DEFAULT_NORMALIZER) can serve every router in the process.
     """
 
     def normalize(self, query: str) -> str:
@@ -31,6 +37,10 @@ class QueryNormalizer(IQueryNormalizer):
         normalized = normalized.strip()
 
         # Collapse multiple spaces to single space
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = _WHITESPACE_RUN.sub(' ', normalized)
 
         return normalized
+
+
+# Shared instance used when wiring routers; QueryNormalizer is stateless
+DEFAULT_NORMALIZER = QueryNormalizer()
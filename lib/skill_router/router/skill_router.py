@@ -1,5 +1,5 @@
 """Main router orchestrating the 3-tier matching pipeline."""
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple
 from lib.skill_router.models import Manifest
 from lib.skill_router.interfaces.router import IRouter, RouteResult
 from lib.skill_router.interfaces.matching import IQueryNormalizer, ISkillMatcher, ITaskMatcher
@@ -18,6 +18,10 @@ class SkillRouter(IRouter):
     4. Tier 3: LLM discovery (fallback)
     5. Resolve dependencies for matched skill(s)
     6. Return RouteResult
+
+    The manifest is fixed for the lifetime of a router, so the execution
+    order for a single skill, or for a task's skill list, is resolved once
+    and reused on later routes.
     """
 
     def __init__(
@@ -45,6 +49,17 @@ class SkillRouter(IRouter):
         self.task_matcher = task_matcher
         self.llm_discovery = llm_discovery
         self.dependency_resolver = dependency_resolver
+        self._skill_execution_orders: Dict[str, Tuple[str, ...]] = {}
+        self._multi_execution_orders: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+        # Tier runners in priority order, each paired with whether its answer
+        # depends only on the normalized query and the manifest; each runner
+        # returns a RouteResult or None
+        self._tiers = (
+            (self._match_direct_skill, True),
+            (self._match_task_trigger, True),
+            (self._match_llm_discovery, False),
+        )
 
     def route(self, query: str) -> RouteResult:
         """Route query through 3-tier pipeline.
@@ -55,58 +70,122 @@ class SkillRouter(IRouter):
         Returns:
             RouteResult with match details and execution order
         """
+        result, _ = self.route_cacheable(query)
+        return result
+
+    def route_cacheable(self, query: str) -> Tuple[RouteResult, bool]:
+        """Route query and report whether the result may be reused.
+
+        Only matches from Tier 1 or Tier 2 are reusable. A Tier 3 answer is
+        not, even when the LLM names a task and the result looks like a
+        task match, and neither is a no-match result.
+
+        Args:
+            query: User's natural language request
+
+        Returns:
+            Tuple of (RouteResult, True if it came from Tier 1 or Tier 2)
+        """
         # Step 1: Normalize query
         normalized = self.normalizer.normalize(query)
         if not normalized:
-            return RouteResult.no_match()
+            return RouteResult.no_match(), False
+
+        # Steps 2-4: run tiers in order; the first match short-circuits
+        for run_tier, deterministic in self._tiers:
+            result = run_tier(query, normalized)
+            if result is not None:
+                return result, deterministic
+
+        # No match at any tier
+        return RouteResult.no_match(), False
 
-        # Step 2: Tier 1 - Direct skill match
+    def _match_direct_skill(self, query: str, normalized: str) -> Optional[RouteResult]:
+        """Tier 1: match a skill name mentioned directly in the query.
+
+        Args:
+            query: Original user query
+            normalized: Normalized query
+
+        Returns:
+            RouteResult for the matched skill, or None if no match
+        """
         tier1_result = self.direct_matcher.match(normalized, self.manifest.skills)
-        if tier1_result.skill_name is not None:
-            execution_order = self._resolve_skill_dependencies(tier1_result.skill_name)
-            return RouteResult.skill_match(tier1_result.skill_name, execution_order)
+        if tier1_result.skill_name is None:
+            return None
+
+        execution_order = self._resolve_skill_dependencies(tier1_result.skill_name)
+        return RouteResult.skill_match(tier1_result.skill_name, execution_order)
+
+    def _match_task_trigger(self, query: str, normalized: str) -> Optional[RouteResult]:
+        """Tier 2: match a task by trigger phrase overlap.
+
+        Args:
+            query: Original user query
+            normalized: Normalized query
 
-        # Step 3: Tier 2 - Task trigger match
+        Returns:
+            RouteResult for the matched task, or None if no match
+        """
         tier2_result = self.task_matcher.match(normalized, self.manifest.tasks)
-        if tier2_result.is_match():
-            execution_order = self._resolve_multi_dependencies(tier2_result.skills)
-            return RouteResult.task_match(
-                tier2_result.task_name,
-                tier2_result.skills,
-                execution_order
-            )
-
-        # Step 4: Tier 3 - LLM discovery
+        if not tier2_result.is_match():
+            return None
+
+        execution_order = self._resolve_multi_dependencies(tier2_result.skills)
+        return RouteResult.task_match(
+            tier2_result.task_name,
+            tier2_result.skills,
+            execution_order
+        )
+
+    def _match_llm_discovery(self, query: str, normalized: str) -> Optional[RouteResult]:
+        """Tier 3: fall back to LLM discovery using the original query.
+
+        Args:
+            query: Original user query
+            normalized: Normalized query
+
+        Returns:
+            RouteResult from LLM discovery, or None if no match
+        """
         tier3_result = self._invoke_llm_discovery(query)
-        if tier3_result.is_match():
-            return tier3_result
+        if not tier3_result.is_match():
+            return None
 
-        # No match at any tier
-        return RouteResult.no_match()
+        return tier3_result
 
-    def _resolve_skill_dependencies(self, skill_name: str) -> List[str]:
+    def _resolve_skill_dependencies(self, skill_name: str) -> Tuple[str, ...]:
         """Resolve dependencies for a single skill.
 
         Args:
             skill_name: Name of the skill
 
         Returns:
-            Ordered list of skills (dependencies first)
+            Ordered tuple of skills (dependencies first)
         """
-        result = self.dependency_resolver.resolve(skill_name, self.manifest.skills)
-        return result.execution_order
-
-    def _resolve_multi_dependencies(self, skill_names: List[str]) -> List[str]:
+        execution_order = self._skill_execution_orders.get(skill_name)
+        if execution_order is None:
+            result = self.dependency_resolver.resolve(skill_name, self.manifest.skills)
+            execution_order = tuple(result.execution_order)
+            self._skill_execution_orders[skill_name] = execution_order
+        return execution_order
+
+    def _resolve_multi_dependencies(self, skill_names: Sequence[str]) -> Tuple[str, ...]:
         """Resolve dependencies for multiple skills.
 
         Args:
-            skill_names: List of skill names
+            skill_names: Skill names to resolve
 
         Returns:
-            Ordered list of all skills (dependencies first)
+            Ordered tuple of all skills (dependencies first)
         """
-        result = self.dependency_resolver.resolve_multi(skill_names, self.manifest.skills)
-        return result.execution_order
+        key = tuple(skill_names)
+        execution_order = self._multi_execution_orders.get(key)
+        if execution_order is None:
+            result = self.dependency_resolver.resolve_multi(key, self.manifest.skills)
+            execution_order = tuple(result.execution_order)
+            self._multi_execution_orders[key] = execution_order
+        return execution_order
 
     def _invoke_llm_discovery(self, query: str) -> RouteResult:
         """Invoke LLM discovery as Tier 3 fallback.
@@ -1,11 +1,18 @@
 """Skill routing service for handling user queries."""
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from lib.skill_router.models import Manifest
 from lib.skill_router.manifest_loader import ManifestLoader
+from lib.skill_router.exceptions import EmptyManifestError
 from lib.skill_router.router.skill_router import SkillRouter
-from lib.skill_router.router.normalizer import QueryNormalizer
+from lib.skill_router.router.normalizer import DEFAULT_NORMALIZER
 from lib.skill_router.matching.direct_matcher import DirectSkillMatcher
 from lib.skill_router.matching.task_matcher import TaskTriggerMatcher
 from lib.skill_router.matching.tokenizer import WordTokenizer
@@ -16,12 +23,16 @@ from lib.skill_router.interfaces.discovery import ILLMDiscovery
 from lib.skill_router.discovery.models import DiscoveryResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RouteResponse:
-    """Response from the skill routing service."""
+    """Response from the skill routing service.
+
+    Responses are cached and shared between callers, so they are frozen
+    and hold tuples.
+    """
     matched_task: Optional[str]
-    skills: List[str]
-    execution_order: List[str]
+    skills: Tuple[str, ...]
+    execution_order: Tuple[str, ...]
     route_type: str
     tier: int
     confidence: float
@@ -39,14 +50,72 @@ class RouteResponse:
 
     @classmethod
     def no_match(cls) -> "RouteResponse":
-        return cls(
-            matched_task=None,
-            skills=[],
-            execution_order=[],
-            route_type=RouteType.ERROR.value,
-            tier=0,
-            confidence=0.0,
-        )
+        return _NO_MATCH_RESPONSE
+
+
+_NO_MATCH_RESPONSE = RouteResponse(
+    matched_task=None,
+    skills=(),
+    execution_order=(),
+    route_type=RouteType.ERROR.value,
+    tier=0,
+    confidence=0.0,
+)
+
+
+_MANIFEST_CACHE_SIZE = 32
+_ROUTE_CACHE_SIZE = 1024
+_manifest_cache: "OrderedDict[Tuple[str, str], Manifest]" = OrderedDict()
+_manifest_cache_lock = threading.Lock()
+
+
+def load_manifest(manifest_path: str) -> Manifest:
+    """Load a manifest, reusing the parsed result while the file is unchanged.
+
+    Parsing and validating YAML dominates service start-up, so services
+    built from the same file share one Manifest. Parsed manifests are kept
+    in a small LRU cache keyed on the file's path and the SHA-256 of its
+    bytes, so any edit produces a fresh load regardless of mtime
+    resolution. Manifests are frozen, which makes sharing them safe.
+
+    Args:
+        manifest_path: Path to the manifest YAML file
+
+    Returns:
+        Parsed and validated Manifest
+
+    Raises:
+        ManifestNotFoundError: If the file does not exist
+        EmptyManifestError: If the file is empty
+        ManifestParseError: If the YAML is invalid
+        ManifestValidationError: If validation fails
+    """
+    path = os.path.abspath(manifest_path)
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        # Let the loader report the missing file with its own error
+        return ManifestLoader().load(manifest_path)
+
+    key = (path, hashlib.sha256(content).hexdigest())
+    with _manifest_cache_lock:
+        manifest = _manifest_cache.get(key)
+        if manifest is not None:
+            _manifest_cache.move_to_end(key)
+            return manifest
+
+    # Parse the bytes that were hashed, not a second read of the file
+    text = content.decode()
+    if not text.strip():
+        raise EmptyManifestError(manifest_path)
+    manifest = ManifestLoader().load_from_string(text)
+
+    with _manifest_cache_lock:
+        _manifest_cache[key] = manifest
+        if len(_manifest_cache) > _MANIFEST_CACHE_SIZE:
+            _manifest_cache.popitem(last=False)
+    return manifest
 
 
 class NoOpLLMDiscovery(ILLMDiscovery):
@@ -66,14 +135,47 @@ class SkillRoutingService:
             manifest_path: Path to the manifest YAML file
             llm_discovery: Optional LLM discovery for Tier 3. Defaults to no-op.
         """
-        loader = ManifestLoader()
-        self.manifest = loader.load(manifest_path)
+        self._initialize(load_manifest(manifest_path), llm_discovery)
+
+    @classmethod
+    def from_mapping(
+        cls,
+        data: Dict[str, Any],
+        llm_discovery: Optional[ILLMDiscovery] = None
+    ) -> "SkillRoutingService":
+        """Create a service from manifest data already held in memory.
+
+        Args:
+            data: Manifest mapping with the same structure as the YAML file
+            llm_discovery: Optional LLM discovery for Tier 3. Defaults to no-op.
+
+        Returns:
+            SkillRoutingService backed by the given manifest
+
+        Raises:
+            ManifestValidationError: If validation fails
+        """
+        service = cls.__new__(cls)
+        service._initialize(ManifestLoader().load_from_dict(data), llm_discovery)
+        return service
+
+    def _initialize(self, manifest: Manifest, llm_discovery: Optional[ILLMDiscovery]) -> None:
+        """Wire the router for a loaded manifest.
+
+        Args:
+            manifest: Parsed and validated Manifest
+            llm_discovery: Optional LLM discovery for Tier 3. Defaults to no-op.
+        """
+        self.manifest = manifest
         self.llm_discovery = llm_discovery or NoOpLLMDiscovery()
         self._router = self._create_router()
+        # Per-instance cache so it is released together with the service
+        self._route_cache: "OrderedDict[str, RouteResponse]" = OrderedDict()
+        self._route_cache_lock = threading.Lock()
 
     def _create_router(self) -> SkillRouter:
         """Create and wire up the skill router with all dependencies."""
-        normalizer = QueryNormalizer()
+        normalizer = DEFAULT_NORMALIZER
         direct_matcher = DirectSkillMatcher(normalizer)
         tokenizer = WordTokenizer()
         scorer = WordOverlapScorer()
@@ -92,26 +194,55 @@ class SkillRoutingService:
     def route(self, query: str) -> RouteResponse:
         """Route a user query to the appropriate skills.
 
+        Tier 1 and Tier 2 matches depend only on the normalized query and
+        the manifest, so queries that normalize to the same text share one
+        cached response. LLM discovery answers, including those naming a
+        task, and no-match responses are never cached: the former are not
+        deterministic and the latter may come from a transient failure.
+
         Args:
             query: User's natural language request
 
         Returns:
             RouteResponse with matched task/skills and execution order
         """
-        result = self._router.route(query)
-        return RouteResponse.from_route_result(result)
-
-    def list_skills(self) -> List[dict]:
+        key = DEFAULT_NORMALIZER.normalize(query)
+        with self._route_cache_lock:
+            response = self._route_cache.get(key)
+            if response is not None:
+                self._route_cache.move_to_end(key)
+                return response
+
+        # The router normalizes for Tiers 1-2 and gives Tier 3 the original text
+        result, cacheable = self._router.route_cacheable(query)
+        response = RouteResponse.from_route_result(result)
+
+        if cacheable:
+            with self._route_cache_lock:
+                self._route_cache[key] = response
+                if len(self._route_cache) > _ROUTE_CACHE_SIZE:
+                    self._route_cache.popitem(last=False)
+        return response
+
+    def list_skills(self) -> Tuple[Mapping[str, str], ...]:
         """List all available skills from the manifest.
 
+        The listing is built once per service and shared between callers,
+        so each entry is a read-only mapping.
+
         Returns:
-            List of skill dictionaries with name, description, and path
+            Tuple of skill mappings with name, description, and path
         """
-        return [
-            {
+        return self._skill_listing
+
+    @functools.cached_property
+    def _skill_listing(self) -> Tuple[Mapping[str, str], ...]:
+        """Build the read-only skill listing on first use."""
+        return tuple(
+            MappingProxyType({
                 "name": name,
                 "description": skill.description,
                 "path": skill.path,
-            }
+            })
             for name, skill in self.manifest.skills.items()
-        ]
+        )
@@ -124,9 +124,10 @@ class TestResolveMultipleSkillsWithSharedDependencies:
         assert execution_order[0] == "terraform-base"
 
         # Both skills appear after terraform-base
-        terraform_idx = execution_order.index("terraform-base")
-        static_idx = execution_order.index("aws-static-hosting")
-        ecs_idx = execution_order.index("aws-ecs-deployment")
+        position = {name: i for i, name in enumerate(execution_order)}
+        terraform_idx = position["terraform-base"]
+        static_idx = position["aws-static-hosting"]
+        ecs_idx = position["aws-ecs-deployment"]
 
         assert static_idx > terraform_idx
         assert ecs_idx > terraform_idx
@@ -193,11 +194,12 @@ class TestResolveTaskSkillsWithComplexDependencies:
         execution_order = result.execution_order
 
         # Get indices
-        terraform_idx = execution_order.index("terraform-base")
-        ecr_idx = execution_order.index("ecr-setup")
-        ecs_idx = execution_order.index("aws-ecs-deployment")
-        rds_idx = execution_order.index("rds-postgres")
-        cognito_idx = execution_order.index("auth-cognito")
+        position = {name: i for i, name in enumerate(execution_order)}
+        terraform_idx = position["terraform-base"]
+        ecr_idx = position["ecr-setup"]
+        ecs_idx = position["aws-ecs-deployment"]
+        rds_idx = position["rds-postgres"]
+        cognito_idx = position["auth-cognito"]
 
         # "terraform-base" appears before all dependent skills
         assert terraform_idx < ecs_idx
@@ -224,10 +226,11 @@ class TestValidateExecutionOrderRespectsAllDependencies:
         execution_order = result.execution_order
 
         # For each skill, verify all dependencies appear before it
+        position = {name: i for i, name in enumerate(execution_order)}
         for i, skill_name in enumerate(execution_order):
             skill = skills_manifest[skill_name]
             for dep in skill.depends_on:
-                dep_idx = execution_order.index(dep)
+                dep_idx = position[dep]
                 assert dep_idx < i, f"Dependency '{dep}' must appear before '{skill_name}'"
 
 
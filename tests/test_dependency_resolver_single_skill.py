@@ -140,9 +140,10 @@ class TestResolveSkillWithMultipleDependencies:
         assert "aws-ecs-deployment" in execution_order
 
         # Assert ordering constraints
-        terraform_idx = execution_order.index("terraform-base")
-        ecr_idx = execution_order.index("ecr-setup")
-        ecs_idx = execution_order.index("aws-ecs-deployment")
+        position = {name: i for i, name in enumerate(execution_order)}
+        terraform_idx = position["terraform-base"]
+        ecr_idx = position["ecr-setup"]
+        ecs_idx = position["aws-ecs-deployment"]
 
         assert terraform_idx < ecs_idx, "terraform-base must appear before aws-ecs-deployment"
         assert ecr_idx < ecs_idx, "ecr-setup must appear before aws-ecs-deployment"
@@ -8,6 +8,7 @@ Scenarios tested:
 - Handle skill name with surrounding punctuation
 """
 import pytest
+from types import MappingProxyType
 from lib.skill_router.models import Skill
 from lib.skill_router.matching.result import MatchResult
 from lib.skill_router.matching.normalizer import DefaultQueryNormalizer
@@ -187,3 +188,39 @@ class TestSkillNameSorting:
 
         # Longest should match first
         assert result.skill_name == "terraform-base-aws"
+
+    def test_standalone_token_does_not_beat_longer_skill_name(self):
+        """A shorter skill appearing as a whole token loses to a longer name."""
+        skills = {
+            "terraform": Skill(name="terraform", description="", path=""),
+            "terraform-base": Skill(name="terraform-base", description="", path=""),
+        }
+
+        normalizer = DefaultQueryNormalizer()
+        matcher = DirectSkillMatcher(normalizer)
+
+        query = "use terraform with 'terraform-base'"
+        result = matcher.match(query, skills)
+
+        assert result.skill_name == "terraform-base"
+
+    def test_skill_added_in_place_is_matched(self):
+        """A dict modified after being matched against is re-indexed."""
+        skills = {"terraform": Skill(name="terraform", description="", path="")}
+        matcher = DirectSkillMatcher(DefaultQueryNormalizer())
+        assert matcher.match("use terraform-base", skills).skill_name == "terraform"
+
+        skills["terraform-base"] = Skill(name="terraform-base", description="", path="")
+
+        assert matcher.match("use terraform-base", skills).skill_name == "terraform-base"
+
+    def test_skill_added_behind_a_proxy_is_matched(self):
+        """A MappingProxyType is a live view, so its names are compared each call."""
+        skills = {"terraform-base": Skill(name="terraform-base", description="", path="")}
+        proxy = MappingProxyType(skills)
+        matcher = DirectSkillMatcher(DefaultQueryNormalizer())
+        assert matcher.match("set up ecr-setup", proxy).skill_name is None
+
+        skills["ecr-setup"] = Skill(name="ecr-setup", description="", path="")
+
+        assert matcher.match("set up ecr-setup", proxy).skill_name == "ecr-setup"
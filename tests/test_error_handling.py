@@ -1,6 +1,7 @@
 """Tests for manifest error handling scenarios."""
 import os
 import tempfile
+from collections.abc import Mapping
 
 import pytest
 
@@ -71,8 +72,8 @@ categories: {}
         # Load should succeed - empty skills section is allowed
         manifest = loader.load_from_string(yaml_without_skills)
 
-        # Verify empty skills section is represented as empty dict
-        assert isinstance(manifest.skills, dict)
+        # Verify empty skills section is represented as an empty mapping
+        assert isinstance(manifest.skills, Mapping)
         assert len(manifest.skills) == 0
 
 
@@ -251,13 +251,13 @@ class TestSkillContext:
         context = SkillContext(
             route_type="skill",
             matched="skill1",
-            execution_order=["skill1", "skill2"],
+            execution_order=("skill1", "skill2"),
             sections=sections
         )
 
         assert context.route_type == "skill"
         assert context.matched == "skill1"
-        assert context.execution_order == ["skill1", "skill2"]
+        assert context.execution_order == ("skill1", "skill2")
         assert len(context.sections) == 2
         assert context.sections[0].name == "skill1"
         assert context.sections[1].name == "skill2"
@@ -267,12 +267,12 @@ class TestSkillContext:
         context = SkillContext(
             route_type="task",
             matched="test-task",
-            execution_order=["skill1"]
+            execution_order=("skill1",)
         )
 
         assert context.route_type == "task"
         assert context.matched == "test-task"
-        assert context.execution_order == ["skill1"]
+        assert context.execution_order == ("skill1",)
         assert context.sections == []
 
     def test_skill_route_type(self):
@@ -280,7 +280,7 @@ class TestSkillContext:
         context = SkillContext(
             route_type="skill",
             matched="test-skill",
-            execution_order=["test-skill"]
+            execution_order=("test-skill",)
         )
 
         assert context.route_type == "skill"
@@ -290,7 +290,7 @@ class TestSkillContext:
         context = SkillContext(
             route_type="task",
             matched="test-task",
-            execution_order=["skill1", "skill2"]
+            execution_order=("skill1", "skill2")
         )
 
         assert context.route_type == "task"
@@ -300,7 +300,7 @@ class TestSkillContext:
         context = SkillContext(
             route_type="discovery",
             matched="discovered-skill",
-            execution_order=["discovered-skill"]
+            execution_order=("discovered-skill",)
         )
 
         assert context.route_type == "discovery"
@@ -316,7 +316,7 @@ class TestSkillContext:
         context = SkillContext(
             route_type="task",
             matched="test-task",
-            execution_order=["primary", "dep1", "dep2"],
+            execution_order=("primary", "dep1", "dep2"),
             sections=sections
         )
 
@@ -0,0 +1,54 @@
+"""Tests for JSONResponseParser.
+
+Based on Gherkin scenarios from tests/bdd/llm-discovery.feature
+Scenarios tested:
+- Successfully parse valid LLM JSON response
+- Handle malformed LLM JSON response
+"""
+import pytest
+
+from lib.skill_router.discovery import response_parser
+from lib.skill_router.discovery.models import LLMResponse
+from lib.skill_router.discovery.response_parser import JSONResponseParser
+from lib.skill_router.exceptions import ParseError
+
+
+VALID_RESPONSE = (
+    '{"type": "skill", "name": "auth-cognito", "confidence": 0.85, '
+    '"reasoning": "Handles user authentication"}'
+)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def parser(request, monkeypatch):
+    """JSONResponseParser using orjson, skipped if it is not installed, and the stdlib."""
+    if request.param == "orjson":
+        monkeypatch.setattr(response_parser, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(response_parser, "orjson", None)
+    return JSONResponseParser()
+
+
+class TestJSONResponseParser:
+    """Test parsing LLM responses with either JSON backend."""
+
+    def test_parse_valid_json_object(self, parser):
+        """A single JSON object should produce one match."""
+        result = parser.parse(LLMResponse(text=VALID_RESPONSE, model="test-model"))
+
+        assert result.top_match.skill_name == "auth-cognito"
+        assert result.top_match.confidence == 0.85
+        assert result.model_used == "test-model"
+
+    def test_parse_json_in_markdown_code_block(self, parser):
+        """JSON wrapped in a markdown code block should be extracted."""
+        text = f"```json\n{VALID_RESPONSE}\n```"
+
+        result = parser.parse(LLMResponse(text=text, model="test-model"))
+
+        assert result.top_match.skill_name == "auth-cognito"
+
+    def test_malformed_json_raises_parse_error(self, parser):
+        """Malformed JSON should raise ParseError regardless of backend."""
+        with pytest.raises(ParseError, match="Invalid JSON"):
+            parser.parse(LLMResponse(text='{"type": "skill", "name": ', model="test-model"))
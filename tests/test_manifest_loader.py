@@ -2,6 +2,9 @@
 import pytest
 import tempfile
 import os
+import sys
+import yaml
+from collections.abc import Mapping
 from pathlib import Path
 from lib.skill_router.manifest_loader import ManifestLoader
 from lib.skill_router.models import Manifest
@@ -91,9 +94,9 @@ class TestManifestLoaderLoadFromString:
 
         assert manifest is not None
         assert isinstance(manifest, Manifest)
-        assert isinstance(manifest.skills, dict)
-        assert isinstance(manifest.tasks, dict)
-        assert isinstance(manifest.categories, dict)
+        assert isinstance(manifest.skills, Mapping)
+        assert isinstance(manifest.tasks, Mapping)
+        assert isinstance(manifest.categories, Mapping)
 
     def test_load_manifest_with_all_skill_fields(self):
         """Scenario: Load manifest with all required skill fields."""
@@ -111,7 +114,7 @@ class TestManifestLoaderLoadFromString:
         assert skill.path == "infrastructure/terraform-base"
 
         # Skill has empty dependency list
-        assert skill.depends_on == []
+        assert skill.depends_on == ()
         assert skill.name == "terraform-base"
 
     def test_load_manifest_with_dependencies(self):
@@ -124,6 +127,22 @@ class TestManifestLoaderLoadFromString:
         ecr_skill = manifest.skills["ecr-setup"]
         assert "terraform-base" in ecr_skill.depends_on
 
+    def test_dependency_names_share_skill_key_objects(self):
+        """Names are interned so references reuse the skill key string."""
+        loader = ManifestLoader()
+        manifest = loader.load_from_string(MANIFEST_WITH_DEPENDENCIES)
+
+        skill_key = next(name for name in manifest.skills if name == "terraform-base")
+        assert manifest.skills["ecr-setup"].depends_on[0] is skill_key
+
+    def test_trigger_phrases_are_interned(self):
+        """Trigger phrases are interned so equal phrases share one object."""
+        loader = ManifestLoader()
+        manifest = loader.load_from_string(MANIFEST_WITH_TASK)
+
+        trigger = manifest.tasks["static-website"].triggers[0]
+        assert trigger is sys.intern("build a static website")
+
     def test_load_manifest_with_task_definitions(self):
         """Scenario: Load manifest with task definitions."""
         loader = ManifestLoader()
@@ -158,6 +177,18 @@ class TestManifestLoaderLoadFromString:
         assert "admin-panel" in category.tasks
 
 
+class TestManifestLoaderLoadFromDict:
+    """Test loading manifests from already parsed data."""
+
+    def test_load_from_dict_matches_yaml(self):
+        """A mapping loads to the same manifest as its YAML form."""
+        loader = ManifestLoader()
+
+        manifest = loader.load_from_dict(yaml.safe_load(MANIFEST_WITH_TASK))
+
+        assert manifest == loader.load_from_string(MANIFEST_WITH_TASK)
+
+
 class TestManifestLoaderLoadFromFile:
     """Test loading manifests from file paths."""
 
@@ -218,7 +249,7 @@ categories: {}
         manifest = loader.load_from_string(yaml_content)
 
         assert "simple-skill" in manifest.skills
-        assert manifest.skills["simple-skill"].depends_on == []
+        assert manifest.skills["simple-skill"].depends_on == ()
 
     def test_task_with_empty_triggers_and_skills(self):
         """Handle task with empty triggers and skills lists."""
@@ -235,5 +266,26 @@ categories: {}
         manifest = loader.load_from_string(yaml_content)
 
         assert "empty-task" in manifest.tasks
-        assert manifest.tasks["empty-task"].triggers == []
-        assert manifest.tasks["empty-task"].skills == []
+        assert manifest.tasks["empty-task"].triggers == ()
+        assert manifest.tasks["empty-task"].skills == ()
+
+    def test_non_string_names_are_loaded_as_is(self):
+        """YAML keys parsed as ints or bools load without being interned."""
+        yaml_content = """
+skills:
+  yes:
+    description: Key parsed as a boolean
+    path: skills/yes
+tasks:
+  404:
+    description: Key parsed as an integer
+    triggers: [page not found, 500]
+    skills: [true]
+categories: {}
+"""
+        loader = ManifestLoader()
+        manifest = loader.load_from_string(yaml_content)
+
+        assert True in manifest.skills
+        assert manifest.tasks[404].triggers == ("page not found", 500)
+        assert manifest.tasks[404].skills == (True,)
@@ -1,5 +1,6 @@
 """Tests for skill router data models."""
 import pytest
+from collections.abc import Mapping
 from dataclasses import FrozenInstanceError
 from lib.skill_router.models import Skill, Task, Category, Manifest
 
@@ -19,7 +20,7 @@ class TestSkillModel:
         assert skill.name == "terraform-base"
         assert skill.description == "Terraform state backend setup"
         assert skill.path == "infrastructure/terraform-base"
-        assert skill.depends_on == ["aws-base"]
+        assert skill.depends_on == ("aws-base",)
 
     def test_skill_empty_dependencies(self):
         """Skill with empty depends_on list."""
@@ -30,18 +31,18 @@ class TestSkillModel:
             depends_on=[]
         )
 
-        assert skill.depends_on == []
+        assert skill.depends_on == ()
 
     def test_skill_default_dependencies(self):
-        """Skill with default depends_on (should be empty list)."""
+        """Skill with default depends_on (should be empty tuple)."""
         skill = Skill(
             name="terraform-base",
             description="Terraform state backend setup",
             path="infrastructure/terraform-base"
         )
 
-        assert skill.depends_on == []
-        assert isinstance(skill.depends_on, list)
+        assert skill.depends_on == ()
+        assert isinstance(skill.depends_on, tuple)
 
 
 class TestTaskModel:
@@ -70,8 +71,15 @@ class TestTaskModel:
             skills=[]
         )
 
-        assert task.triggers == []
-        assert task.skills == []
+        assert task.triggers == ()
+        assert task.skills == ()
+
+    def test_task_is_frozen(self):
+        """Task fields cannot be reassigned after construction."""
+        task = Task(name="static-website", description="Static website")
+
+        with pytest.raises(FrozenInstanceError):
+            task.skills = ("nextjs-standards",)
 
 
 class TestCategoryModel:
@@ -92,16 +100,16 @@ class TestCategoryModel:
         assert len(category.skills) == 1
 
     def test_category_default_lists(self):
-        """Category with default tasks and skills (should be empty lists)."""
+        """Category with default tasks and skills (should be empty tuples)."""
         category = Category(
             name="web-development",
             description="Websites and web applications"
         )
 
-        assert category.tasks == []
-        assert category.skills == []
-        assert isinstance(category.tasks, list)
-        assert isinstance(category.skills, list)
+        assert category.tasks == ()
+        assert category.skills == ()
+        assert isinstance(category.tasks, tuple)
+        assert isinstance(category.skills, tuple)
 
 
 class TestManifestModel:
@@ -137,9 +145,9 @@ class TestManifestModel:
         assert "terraform-base" in manifest.skills
         assert "static-website" in manifest.tasks
         assert "web-development" in manifest.categories
-        assert isinstance(manifest.skills, dict)
-        assert isinstance(manifest.tasks, dict)
-        assert isinstance(manifest.categories, dict)
+        assert isinstance(manifest.skills, Mapping)
+        assert isinstance(manifest.tasks, Mapping)
+        assert isinstance(manifest.categories, Mapping)
 
     def test_manifest_empty_dictionaries(self):
         """Manifest with empty dictionaries."""
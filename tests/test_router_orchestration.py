@@ -55,6 +55,7 @@ class TestTierFlowShortCircuit:
         # Verify Tier 2 and 3 were NOT invoked
         task_matcher.match.assert_not_called()
         llm_discovery.discover.assert_not_called()
+        assert router.route_cacheable("use terraform-base") == (result, True)
 
     def test_tier2_executes_only_when_tier1_fails(self):
         """Tier 2 should execute only when Tier 1 finds no match."""
@@ -172,8 +173,8 @@ class TestRouteResultConstruction:
         # Assert
         assert result.route_type == RouteType.SKILL
         assert result.matched == "ecr-setup"
-        assert result.skills == ["ecr-setup"]
-        assert result.execution_order == ["aws-base", "ecr-setup"]
+        assert result.skills == ("ecr-setup",)
+        assert result.execution_order == ("aws-base", "ecr-setup")
         assert result.tier == 1
         assert result.confidence == 1.0
 
@@ -214,8 +215,8 @@ class TestRouteResultConstruction:
         # Assert
         assert result.route_type == RouteType.TASK
         assert result.matched == "rest-api"
-        assert result.skills == ["fastapi-standards", "aws-ecs-deployment", "rds-postgres"]
-        assert result.execution_order == ["fastapi-standards", "aws-ecs-deployment", "rds-postgres"]
+        assert result.skills == ("fastapi-standards", "aws-ecs-deployment", "rds-postgres")
+        assert result.execution_order == ("fastapi-standards", "aws-ecs-deployment", "rds-postgres")
         assert result.tier == 2
 
     def test_discovery_match_returns_correct_route_result(self):
@@ -250,6 +251,72 @@ class TestRouteResultConstruction:
         assert result.confidence == 0.78
 
 
+class TestDependencyResolutionReuse:
+    """Test that resolved execution orders are reused across routes."""
+
+    def test_single_skill_resolved_once_per_router(self):
+        """Repeated Tier 1 matches for a skill should resolve dependencies once."""
+        # Arrange
+        manifest = Manifest(
+            skills={
+                "ecr-setup": Skill("ecr-setup", "AWS ECR setup", "/path", ["aws-base"]),
+                "aws-base": Skill("aws-base", "AWS base config", "/path", [])
+            }
+        )
+        normalizer = QueryNormalizer()
+        direct_matcher = Mock()
+        direct_matcher.match.return_value = MatchResult.exact_match("ecr-setup")
+        task_matcher = Mock()
+        llm_discovery = Mock()
+        dependency_resolver = Mock()
+        dependency_resolver.resolve.return_value = DependencyResult(execution_order=["aws-base", "ecr-setup"])
+
+        router = SkillRouter(manifest, normalizer, direct_matcher, task_matcher, llm_discovery, dependency_resolver)
+
+        # Act
+        first = router.route("apply ecr-setup")
+        second = router.route("use ecr-setup")
+
+        # Assert
+        assert first.execution_order == ("aws-base", "ecr-setup")
+        assert second.execution_order == ("aws-base", "ecr-setup")
+        dependency_resolver.resolve.assert_called_once()
+
+    def test_task_skills_resolved_once_per_router(self):
+        """Repeated Tier 2 matches for a task should resolve dependencies once."""
+        # Arrange
+        manifest = Manifest(
+            skills={
+                "ecr-setup": Skill("ecr-setup", "AWS ECR setup", "/path", ["aws-base"]),
+                "aws-base": Skill("aws-base", "AWS base config", "/path", [])
+            },
+            tasks={
+                "container-registry": Task("container-registry", "Registry", ["set up a registry"], ["ecr-setup"])
+            }
+        )
+        normalizer = QueryNormalizer()
+        direct_matcher = Mock()
+        direct_matcher.match.return_value = MatchResult.no_match()
+        task_matcher = Mock()
+        task_matcher.match.return_value = TaskMatchResult.from_task(
+            "container-registry", 1.0, "set up a registry", ["ecr-setup"]
+        )
+        llm_discovery = Mock()
+        dependency_resolver = Mock()
+        dependency_resolver.resolve_multi.return_value = DependencyResult(execution_order=["aws-base", "ecr-setup"])
+
+        router = SkillRouter(manifest, normalizer, direct_matcher, task_matcher, llm_discovery, dependency_resolver)
+
+        # Act
+        first = router.route("set up a registry")
+        second = router.route("please set up a registry")
+
+        # Assert
+        assert first.execution_order == ("aws-base", "ecr-setup")
+        assert second.execution_order == ("aws-base", "ecr-setup")
+        dependency_resolver.resolve_multi.assert_called_once()
+
+
 class TestQueryNormalization:
     """Test query normalization behavior."""
 
@@ -297,8 +364,8 @@ class TestErrorHandling:
         # Assert
         assert result.route_type == RouteType.ERROR
         assert result.matched == ""
-        assert result.skills == []
-        assert result.execution_order == []
+        assert result.skills == ()
+        assert result.execution_order == ()
         assert result.tier == 0
         assert result.confidence == 0.0
 
@@ -409,7 +476,11 @@ class TestLLMDiscoveryTaskFallback:
         # Assert
         assert result.route_type == RouteType.TASK
         assert result.matched == "rest-api"
-        assert result.skills == ["fastapi-standards"]
+        assert result.skills == ("fastapi-standards",)
+
+        # A task named by the LLM is still a Tier 3 answer
+        _, cacheable = router.route_cacheable("help me build api")
+        assert not cacheable
 
 
 class TestRouteResultIsMatch:
@@ -434,3 +505,10 @@ class TestRouteResultIsMatch:
         """is_match() should return False for error results."""
         result = RouteResult.no_match()
         assert result.is_match() is False
+
+    def test_route_result_is_hashable(self):
+        """Tuple-backed RouteResult instances can be used as cache values and keys."""
+        first = RouteResult.task_match("test-task", ["skill1"], ["skill1"])
+        second = RouteResult.task_match("test-task", ("skill1",), ("skill1",))
+        assert hash(first) == hash(second)
+        assert RouteResult.no_match() is RouteResult.no_match()
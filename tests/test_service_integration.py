@@ -3,79 +3,102 @@
 These tests use real manifest data and real components - no mocks.
 """
 import os
-import tempfile
 import pytest
-
-from lib.skill_router.service import SkillRoutingService, RouteResponse
-
-
-SAMPLE_MANIFEST = """
-skills:
-  terraform-base:
-    description: "Terraform state backend, providers, and module conventions"
-    path: infrastructure/terraform-base
-    depends_on: []
-
-  ecr-setup:
-    description: "AWS ECR container registry setup"
-    path: infrastructure/ecr-setup
-    depends_on: [terraform-base]
-
-  aws-ecs-deployment:
-    description: "ECS Fargate container deployment with load balancing"
-    path: infrastructure/aws-ecs-deployment
-    depends_on: [terraform-base, ecr-setup]
-
-  nextjs-standards:
-    description: "Next.js project structure and conventions"
-    path: frameworks/nextjs-standards
-    depends_on: []
-
-  fastapi-standards:
-    description: "FastAPI project structure and conventions"
-    path: frameworks/fastapi-standards
-    depends_on: []
-
-tasks:
-  container-service:
-    description: "Containerized service deployment to AWS ECS"
-    triggers:
-      - "deploy my app to AWS ECS"
-      - "deploy to ECS"
-      - "containerized service"
-    skills: [aws-ecs-deployment]
-
-  static-website:
-    description: "Static website or landing page"
-    triggers:
-      - "build a static website"
-      - "create a landing page"
-    skills: [nextjs-standards]
-
-  api-backend:
-    description: "REST API backend service"
-    triggers:
-      - "create a REST API"
-      - "build an API backend"
-      - "fastapi backend"
-    skills: [fastapi-standards]
-"""
-
-
-@pytest.fixture
-def manifest_file():
-    """Create a temporary manifest file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        f.write(SAMPLE_MANIFEST)
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
-
-
-@pytest.fixture
-def service(manifest_file):
-    """Create a SkillRoutingService instance."""
-    return SkillRoutingService(manifest_file)
+import yaml
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+from lib.skill_router.service import SkillRoutingService, RouteResponse, load_manifest
+from lib.skill_router.interfaces.discovery import ILLMDiscovery
+from lib.skill_router.discovery.models import DiscoveryResult, SkillMatch
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SAMPLE_MANIFEST_DICT = {
+    "skills": {
+        "terraform-base": {
+            "description": "Terraform state backend, providers, and module conventions",
+            "path": "infrastructure/terraform-base",
+            "depends_on": [],
+        },
+        "ecr-setup": {
+            "description": "AWS ECR container registry setup",
+            "path": "infrastructure/ecr-setup",
+            "depends_on": ["terraform-base"],
+        },
+        "aws-ecs-deployment": {
+            "description": "ECS Fargate container deployment with load balancing",
+            "path": "infrastructure/aws-ecs-deployment",
+            "depends_on": ["terraform-base", "ecr-setup"],
+        },
+        "nextjs-standards": {
+            "description": "Next.js project structure and conventions",
+            "path": "frameworks/nextjs-standards",
+            "depends_on": [],
+        },
+        "fastapi-standards": {
+            "description": "FastAPI project structure and conventions",
+            "path": "frameworks/fastapi-standards",
+            "depends_on": [],
+        },
+    },
+    "tasks": {
+        "container-service": {
+            "description": "Containerized service deployment to AWS ECS",
+            "triggers": [
+                "deploy my app to AWS ECS",
+                "deploy to ECS",
+                "containerized service",
+            ],
+            "skills": ["aws-ecs-deployment"],
+        },
+        "static-website": {
+            "description": "Static website or landing page",
+            "triggers": [
+                "build a static website",
+                "create a landing page",
+            ],
+            "skills": ["nextjs-standards"],
+        },
+        "api-backend": {
+            "description": "REST API backend service",
+            "triggers": [
+                "create a REST API",
+                "build an API backend",
+                "fastapi backend",
+            ],
+            "skills": ["fastapi-standards"],
+        },
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def manifest_file(tmp_path_factory):
+    """Write the sample manifest as YAML for tests covering the file loader."""
+    path = tmp_path_factory.mktemp("skills") / "manifest.yaml"
+    path.write_text(yaml.safe_dump(SAMPLE_MANIFEST_DICT))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def service():
+    """Create a SkillRoutingService instance shared by read-only routing tests."""
+    return SkillRoutingService.from_mapping(SAMPLE_MANIFEST_DICT)
+
+
+class RecordingDiscovery(ILLMDiscovery):
+    """LLM discovery stub that records queries and returns a fixed skill."""
+
+    def __init__(self, skill_name):
+        self.skill_name = skill_name
+        self.queries = []
+
+    def discover(self, query, skill_summaries, max_results=3):
+        self.queries.append(query)
+        matches = [SkillMatch(self.skill_name, 0.8, "stub")] if self.skill_name else []
+        return DiscoveryResult(matches=matches, raw_response="", model_used="stub")
 
 
 class TestServiceRouting:
@@ -86,8 +109,8 @@ class TestServiceRouting:
         response = service.route("I want to use terraform-base")
 
         assert response.matched_task == "terraform-base"
-        assert response.skills == ["terraform-base"]
-        assert response.execution_order == ["terraform-base"]
+        assert response.skills == ("terraform-base",)
+        assert response.execution_order == ("terraform-base",)
         assert response.route_type == "skill"
         assert response.tier == 1
         assert response.confidence == 1.0
@@ -97,7 +120,7 @@ class TestServiceRouting:
         response = service.route("deploy my app to AWS ECS")
 
         assert response.matched_task == "container-service"
-        assert response.skills == ["aws-ecs-deployment"]
+        assert response.skills == ("aws-ecs-deployment",)
         assert response.route_type == "task"
         assert response.tier == 2
         # Execution order should include dependencies
@@ -110,8 +133,8 @@ class TestServiceRouting:
         response = service.route("build a static website")
 
         assert response.matched_task == "static-website"
-        assert response.skills == ["nextjs-standards"]
-        assert response.execution_order == ["nextjs-standards"]
+        assert response.skills == ("nextjs-standards",)
+        assert response.execution_order == ("nextjs-standards",)
         assert response.route_type == "task"
         assert response.tier == 2
 
@@ -120,7 +143,7 @@ class TestServiceRouting:
         response = service.route("create a REST API")
 
         assert response.matched_task == "api-backend"
-        assert response.skills == ["fastapi-standards"]
+        assert response.skills == ("fastapi-standards",)
         assert response.route_type == "task"
         assert response.tier == 2
 
@@ -129,8 +152,8 @@ class TestServiceRouting:
         response = service.route("do something completely unrelated xyz123")
 
         assert response.matched_task is None
-        assert response.skills == []
-        assert response.execution_order == []
+        assert response.skills == ()
+        assert response.execution_order == ()
         assert response.route_type == "error"
         assert response.tier == 0
         assert response.confidence == 0.0
@@ -142,8 +165,8 @@ class TestServiceRouting:
         # aws-ecs-deployment depends on terraform-base and ecr-setup
         # ecr-setup depends on terraform-base
         # So order should be: terraform-base -> ecr-setup -> aws-ecs-deployment
-        assert response.execution_order.index("terraform-base") < response.execution_order.index("ecr-setup")
-        assert response.execution_order.index("ecr-setup") < response.execution_order.index("aws-ecs-deployment")
+        position = {name: i for i, name in enumerate(response.execution_order)}
+        assert position["terraform-base"] < position["ecr-setup"] < position["aws-ecs-deployment"]
 
     def test_case_insensitive_matching(self, service):
         """Matching should be case-insensitive."""
@@ -159,6 +182,98 @@ class TestServiceRouting:
         assert response.matched_task == "container-service"
         assert response.route_type == "task"
 
+    def test_equivalent_queries_share_cached_response(self, service):
+        """Queries normalizing to the same text return the same response."""
+        first = service.route("create a REST API")
+        second = service.route("  Create a   REST API ")
+
+        assert second is first
+
+    def test_discovery_gets_original_query_and_is_not_cached(self):
+        """Tier 3 sees the query as typed and is consulted on every call."""
+        discovery = RecordingDiscovery("ecr-setup")
+        llm_service = SkillRoutingService.from_mapping(SAMPLE_MANIFEST_DICT, llm_discovery=discovery)
+
+        first = llm_service.route("Push My Image")
+        second = llm_service.route("push my image")
+
+        assert first.route_type == "discovery"
+        assert second is not first
+        assert discovery.queries == ["Push My Image", "push my image"]
+
+    def test_discovered_task_is_not_cached(self):
+        """A task named by the LLM is not cached even though it looks like Tier 2."""
+        discovery = RecordingDiscovery("static-website")
+        llm_service = SkillRoutingService.from_mapping(SAMPLE_MANIFEST_DICT, llm_discovery=discovery)
+
+        first = llm_service.route("make me a portfolio page")
+        second = llm_service.route("Make me a portfolio page")
+
+        assert first.matched_task == "static-website"
+        assert second is not first
+        assert discovery.queries == ["make me a portfolio page", "Make me a portfolio page"]
+
+    def test_no_match_is_not_cached(self):
+        """A no-match response is recomputed so a later LLM answer can win."""
+        discovery = RecordingDiscovery(None)
+        llm_service = SkillRoutingService.from_mapping(SAMPLE_MANIFEST_DICT, llm_discovery=discovery)
+
+        assert llm_service.route("push my image").route_type == "error"
+        discovery.skill_name = "ecr-setup"
+
+        assert llm_service.route("push my image").route_type == "discovery"
+
+    def test_list_skills_is_cached_and_read_only(self, service):
+        """list_skills() should return the same read-only listing each call."""
+        skills = service.list_skills()
+
+        assert service.list_skills() is skills
+        assert {skill["name"] for skill in skills} == set(SAMPLE_MANIFEST_DICT["skills"])
+        with pytest.raises(TypeError):
+            skills[0]["path"] = "elsewhere"
+
+
+class TestManifestCache:
+    """Test reuse of parsed manifests across service instances."""
+
+    def test_services_share_manifest_for_unchanged_file(self, manifest_file):
+        """Services built from the same unchanged file share one Manifest."""
+        first = SkillRoutingService(manifest_file)
+        second = SkillRoutingService(manifest_file)
+
+        assert first.manifest is second.manifest
+
+    def test_file_and_mapping_services_route_alike(self, manifest_file, service):
+        """A service loaded from YAML routes the same as one built from the dict."""
+        file_service = SkillRoutingService(manifest_file)
+
+        assert file_service.route("deploy to ECS") == service.route("deploy to ECS")
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """A same-size edit within one mtime tick still reloads the Manifest."""
+        path = tmp_path / "manifest.yaml"
+        sample = yaml.safe_dump(SAMPLE_MANIFEST_DICT)
+        path.write_text(sample)
+        stat = path.stat()
+        original = load_manifest(str(path))
+
+        path.write_text(sample.replace("static-website:", "static-webpage:"))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        reloaded = load_manifest(str(path))
+
+        assert path.stat().st_size == stat.st_size
+        assert reloaded is not original
+        assert "static-webpage" in reloaded.tasks
+
+    def test_cached_manifest_is_read_only(self, manifest_file):
+        """The shared cached Manifest cannot be modified by one caller."""
+        manifest = load_manifest(manifest_file)
+
+        with pytest.raises(TypeError):
+            manifest.tasks["extra"] = manifest.tasks["static-website"]
+        with pytest.raises(FrozenInstanceError):
+            manifest.skills["terraform-base"].depends_on = ()
+
 
 class TestRouteResponseDataclass:
     """Test RouteResponse dataclass behavior."""
@@ -168,22 +283,32 @@ class TestRouteResponseDataclass:
         response = RouteResponse.no_match()
 
         assert response.matched_task is None
-        assert response.skills == []
-        assert response.execution_order == []
+        assert response.skills == ()
+        assert response.execution_order == ()
         assert response.route_type == "error"
         assert response.tier == 0
         assert response.confidence == 0.0
 
+    def test_no_match_returns_shared_instance(self):
+        """RouteResponse.no_match() should not allocate per call."""
+        assert RouteResponse.no_match() is RouteResponse.no_match()
+
+    def test_response_is_immutable_and_hashable(self, service):
+        """Routed responses should be frozen and usable as dict keys."""
+        response = service.route("use terraform-base")
+
+        with pytest.raises(AttributeError):
+            response.tier = 2
+        assert {response: True}[response]
+
 
 class TestSkillPathValidation:
     """Test that skill paths exist and have contents using real manifest.yaml."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def real_manifest_service(self):
-        """Load the real manifest.yaml from the repo root."""
-        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        manifest_path = os.path.join(repo_root, "manifest.yaml")
-        return SkillRoutingService(manifest_path), repo_root
+        """Load the real manifest.yaml from the repo root once per session."""
+        return SkillRoutingService(str(REPO_ROOT / "manifest.yaml")), str(REPO_ROOT)
 
     def test_all_skill_paths_exist(self, real_manifest_service):
         """All skill paths in manifest should exist as directories."""
@@ -202,5 +327,5 @@ class TestSkillPathValidation:
 
         for skill in skills:
             path = os.path.join(repo_root, skill["path"])
-            contents = os.listdir(path)
-            assert len(contents) > 0, f"Skill path is empty: {path}"
+            with os.scandir(path) as entries:
+                assert next(entries, None) is not None, f"Skill path is empty: {path}"
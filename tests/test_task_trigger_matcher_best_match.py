@@ -9,13 +9,14 @@ from lib.skill_router.models import Task
 class TestBestMatchSelection(unittest.TestCase):
     """Test best match selection scenarios."""
 
-    def setUp(self):
-        """Set up matcher and test tasks."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up a matcher and test tasks shared by all tests."""
         tokenizer = WordTokenizer()
         scorer = WordOverlapScorer(threshold=0.6)
-        self.matcher = TaskTriggerMatcher(tokenizer, scorer)
+        cls.matcher = TaskTriggerMatcher(tokenizer, scorer)
 
-        self.tasks = {
+        cls.tasks = {
             "static-website": Task(
                 name="static-website",
                 description="Static website hosting",
@@ -122,13 +123,14 @@ class TestBestMatchSelection(unittest.TestCase):
 
     def test_task_with_no_triggers_never_matches(self):
         """Test task with empty triggers list never matches."""
-        tasks_with_empty = self.tasks.copy()
-        tasks_with_empty["no-triggers"] = Task(
-            name="no-triggers",
-            description="Task without triggers",
-            triggers=[],
-            skills=["some-skill"]
-        )
+        tasks_with_empty = dict(self.tasks, **{
+            "no-triggers": Task(
+                name="no-triggers",
+                description="Task without triggers",
+                triggers=[],
+                skills=["some-skill"]
+            )
+        })
 
         result = self.matcher.match("build something", tasks_with_empty)
 
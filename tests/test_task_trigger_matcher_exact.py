@@ -1,9 +1,13 @@
 """Tests for exact trigger matching with case and whitespace normalization."""
+import sys
 import unittest
+from threading import Thread
+from types import MappingProxyType
+from unittest.mock import Mock, patch
 from lib.skill_router.matching.tokenizer import WordTokenizer
 from lib.skill_router.matching.scorer import WordOverlapScorer
 from lib.skill_router.matching.task_matcher import TaskTriggerMatcher
-from lib.skill_router.models import Task
+from lib.skill_router.models import FrozenDict, Manifest, Task
 
 
 class TestWordTokenizer(unittest.TestCase):
@@ -43,6 +47,19 @@ class TestWordTokenizer(unittest.TestCase):
         result = self.tokenizer.tokenize("BuIlD a StAtIc WeBsItE")
         self.assertEqual(result, {"build", "a", "static", "website"})
 
+    def test_tokenize_returns_hashable_word_set(self):
+        """Test tokenizer returns a frozenset and keeps punctuation inside words."""
+        result = self.tokenizer.tokenize("Deploy terraform-base")
+        self.assertIsInstance(result, frozenset)
+        self.assertEqual(result, {"deploy", "terraform-base"})
+
+    def test_tokenize_reuses_word_set_for_repeated_text(self):
+        """Test repeated text returns the cached word set."""
+        WordTokenizer.cache_clear()
+        first = self.tokenizer.tokenize("create a REST API")
+        second = WordTokenizer().tokenize("create a REST API")
+        self.assertIs(second, first)
+
 
 class TestWordOverlapScorer(unittest.TestCase):
     """Test WordOverlapScorer overlap calculation."""
@@ -78,6 +95,16 @@ class TestWordOverlapScorer(unittest.TestCase):
         score = self.scorer.score(query_words, trigger_words)
         self.assertEqual(score, 0.0)
 
+    def test_short_query_returns_zero_without_intersecting(self):
+        """Test a query too short to reach the threshold is rejected early."""
+        query_words = Mock(spec=frozenset)
+        query_words.__len__ = Mock(return_value=2)
+        trigger_words = frozenset({"build", "a", "static", "website"})
+        # At most 2/4 = 0.5 < 0.6
+
+        score = self.scorer.score(query_words, trigger_words)
+        self.assertEqual(score, 0.0)
+
     def test_empty_trigger_words_returns_zero(self):
         """Test empty trigger words returns 0.0."""
         query_words = {"build", "website"}
@@ -187,6 +214,125 @@ class TestTaskTriggerMatcherExact(unittest.TestCase):
         self.assertFalse(result.is_match())
         self.assertIsNone(result.task_name)
 
+    def test_trigger_phrases_tokenized_once_across_matches(self):
+        """Test repeated matches only tokenize the query, not every trigger."""
+        tokenizer = Mock(wraps=WordTokenizer())
+        matcher = TaskTriggerMatcher(tokenizer, WordOverlapScorer(threshold=0.6))
+
+        first = matcher.match("create a dashboard", self.tasks)
+        calls_after_first = tokenizer.tokenize.call_count
+        second = matcher.match("create a dashboard", self.tasks)
+
+        self.assertEqual(second, first)
+        self.assertEqual(tokenizer.tokenize.call_count, calls_after_first + 1)
+
+    def test_perfect_score_stops_trigger_scan(self):
+        """Test a perfect match returns without scoring later triggers."""
+        scorer = Mock(wraps=WordOverlapScorer(threshold=0.6))
+        matcher = TaskTriggerMatcher(WordTokenizer(), scorer)
+
+        result = matcher.match("build a static website", self.tasks)
+
+        self.assertEqual(result.matched_trigger, "build a static website")
+        self.assertEqual(scorer.score.call_count, 1)
+
+    def test_exact_trigger_query_scores_one_trigger(self):
+        """Test a query equal to a later trigger skips scoring earlier ones."""
+        scorer = Mock(wraps=WordOverlapScorer(threshold=0.6))
+        matcher = TaskTriggerMatcher(WordTokenizer(), scorer)
+
+        result = matcher.match("Create a Dashboard", self.tasks)
+
+        self.assertEqual(result.task_name, "admin-panel")
+        self.assertEqual(result.matched_trigger, "create a dashboard")
+        self.assertEqual(scorer.score.call_count, 1)
+
+    def test_exact_trigger_query_keeps_earlier_contained_trigger(self):
+        """Test an earlier trigger contained in the query still wins the tie."""
+        tasks = {
+            "short": Task(name="short", description="", triggers=["deploy app"], skills=["a"]),
+            "long": Task(name="long", description="", triggers=["deploy app now"], skills=["b"]),
+        }
+
+        result = self.matcher.match("deploy app now", tasks)
+
+        self.assertEqual(result.task_name, "short")
+        self.assertEqual(result.score, 1.0)
+
+    def test_triggers_without_shared_words_are_not_scored(self):
+        """Test only triggers sharing a word with the query reach the scorer."""
+        scorer = Mock(wraps=WordOverlapScorer(threshold=0.6))
+        matcher = TaskTriggerMatcher(WordTokenizer(), scorer)
+
+        matcher.match("internal dashboard", self.tasks)
+
+        # Only two admin-panel triggers use these words
+        scored = [call.args[1] for call in scorer.score.call_args_list]
+        self.assertEqual(scored, [{"create", "a", "dashboard"}, {"create", "an", "internal", "tool"}])
+
+    def test_tasks_added_in_place_are_matched(self):
+        """Test a dict modified after being matched against is re-indexed."""
+        tasks = {"a": Task(name="a", description="", triggers=["deploy app"], skills=["x"])}
+        self.assertFalse(self.matcher.match("ship it", tasks).is_match())
+
+        tasks["b"] = Task(name="b", description="", triggers=["ship it"], skills=["y"])
+        result = self.matcher.match("ship it", tasks)
+
+        self.assertEqual(result.task_name, "b")
+
+    def test_tasks_added_behind_a_proxy_are_matched(self):
+        """Test a MappingProxyType is treated as a live view, not a snapshot."""
+        tasks = {"a": Task(name="a", description="", triggers=["deploy app"], skills=["x"])}
+        proxy = MappingProxyType(tasks)
+        self.assertFalse(self.matcher.match("ship it", proxy).is_match())
+
+        tasks["b"] = Task(name="b", description="", triggers=["ship it"], skills=["y"])
+        result = self.matcher.match("ship it", proxy)
+
+        self.assertEqual(result.task_name, "b")
+
+    def test_manifest_tasks_reuse_index_by_identity(self):
+        """Test the frozen Manifest.tasks is not re-read on later matches."""
+        manifest = Manifest(tasks=self.tasks)
+        self.matcher.match("create a dashboard", manifest.tasks)
+
+        with patch.object(FrozenDict, "items", side_effect=AssertionError("re-read")):
+            result = self.matcher.match("create a dashboard", manifest.tasks)
+
+        self.assertEqual(result.task_name, "admin-panel")
+
+    def test_concurrent_matches_against_different_mappings(self):
+        """Test threads re-indexing for different mappings never see a partial index."""
+        other_tasks = {
+            "deploy": Task(name="deploy", description="", triggers=["ship it"], skills=["ecs"]),
+        }
+        cases = [
+            ("create a dashboard", self.tasks, "admin-panel"),
+            ("ship it", other_tasks, "deploy"),
+        ]
+        failures = []
+
+        def worker(query, tasks, expected):
+            for _ in range(2000):
+                # Fresh mappings force a re-index on every call
+                result = self.matcher.match(query, dict(tasks))
+                if result.task_name != expected:
+                    failures.append(result)
+
+        threads = [Thread(target=worker, args=case) for case in cases for _ in range(2)]
+        # Switch threads often so a half-published index would be observed
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(failures, [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for Task Trigger Matching interfaces and TaskMatchResult model."""
 import unittest
+from dataclasses import FrozenInstanceError
 from lib.skill_router.matching.result import TaskMatchResult
 from lib.skill_router.interfaces.matching import (
     ITaskMatcher,
@@ -18,7 +19,7 @@ class TestTaskMatchResult(unittest.TestCase):
         self.assertIsNone(result.task_name)
         self.assertEqual(result.score, 0.0)
         self.assertIsNone(result.matched_trigger)
-        self.assertEqual(result.skills, [])
+        self.assertEqual(result.skills, ())
         self.assertFalse(result.is_match())
 
     def test_from_task_factory(self):
@@ -34,7 +35,7 @@ class TestTaskMatchResult(unittest.TestCase):
         self.assertEqual(result.task_name, "test-task")
         self.assertEqual(result.score, 0.95)
         self.assertEqual(result.matched_trigger, "build a test")
-        self.assertEqual(result.skills, ["skill1", "skill2", "skill3"])
+        self.assertEqual(result.skills, ("skill1", "skill2", "skill3"))
         self.assertTrue(result.is_match())
 
     def test_from_task_copies_skills_list(self):
@@ -51,7 +52,30 @@ class TestTaskMatchResult(unittest.TestCase):
         original_skills.append("skill3")
 
         # Result should not be affected
-        self.assertEqual(result.skills, ["skill1", "skill2"])
+        self.assertEqual(result.skills, ("skill1", "skill2"))
+
+    def test_from_task_shares_tuple_skills(self):
+        """Test from_task() reuses an already-immutable skills tuple."""
+        task_skills = ("skill1", "skill2")
+        result = TaskMatchResult.from_task(
+            task_name="test-task",
+            score=1.0,
+            matched_trigger="trigger",
+            skills=task_skills
+        )
+
+        self.assertIs(result.skills, task_skills)
+
+    def test_no_match_returns_shared_instance(self):
+        """Test no_match() does not allocate a new result per call."""
+        self.assertIs(TaskMatchResult.no_match(), TaskMatchResult.no_match())
+
+    def test_result_is_frozen(self):
+        """Test results cannot be modified after construction."""
+        result = TaskMatchResult.from_task("test-task", 1.0, "trigger", ("skill1",))
+
+        with self.assertRaises(FrozenInstanceError):
+            result.score = 0.5
 
     def test_is_match_returns_true_when_task_matched(self):
         """Test is_match() returns True when task_name is set."""
@@ -79,7 +103,7 @@ class TestTaskMatchResult(unittest.TestCase):
             skills=[]
         )
 
-        self.assertEqual(result.skills, [])
+        self.assertEqual(result.skills, ())
         self.assertTrue(result.is_match())
 
 
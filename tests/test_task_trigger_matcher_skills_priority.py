@@ -47,7 +47,7 @@ class TestSkillsResolution(unittest.TestCase):
 
         self.assertEqual(
             result.skills,
-            ["nextjs-standards", "aws-static-hosting", "github-actions-cicd"]
+            ("nextjs-standards", "aws-static-hosting", "github-actions-cicd")
         )
 
     def test_empty_skills_list_handled(self):
@@ -56,14 +56,14 @@ class TestSkillsResolution(unittest.TestCase):
 
         self.assertTrue(result.is_match())
         self.assertEqual(result.task_name, "no-skills-task")
-        self.assertEqual(result.skills, [])
+        self.assertEqual(result.skills, ())
 
     def test_no_match_has_empty_skills(self):
         """Test no match result has empty skills list."""
         result = self.matcher.match("unrelated query", self.tasks)
 
         self.assertFalse(result.is_match())
-        self.assertEqual(result.skills, [])
+        self.assertEqual(result.skills, ())
 
 
 class TestTierPriorityConcept(unittest.TestCase):